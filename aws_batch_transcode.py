@@ -388,7 +388,7 @@ class AWSBatchTranscoder:
             TimeoutError: If job doesn't complete within timeout
         """
         terminal_states = {'SUCCEEDED', 'FAILED'}
-        start_time = time.time()
+        start_time = time.monotonic()
 
         logger.info(f"Waiting for Batch job {job_id} (timeout: {timeout}s)")
 
@@ -405,7 +405,7 @@ class AWSBatchTranscoder:
                 logger.error(f"Job {job_id} not found")
                 return status
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             if elapsed > timeout:
                 logger.error(f"Timeout waiting for job {job_id} after {elapsed:.0f}s")
                 raise TimeoutError(f"Job {job_id} did not complete within {timeout}s")
@@ -26,6 +26,7 @@ import os
 import requests
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Callable
 from logging_service import get_logger
 
@@ -38,46 +39,110 @@ READ_TIMEOUT = 60  # seconds to wait for data between chunks
 CONNECT_TIMEOUT = 10  # seconds to establish connection
 MAX_DOWNLOAD_RETRIES = 20  # more retries with resume capability
 KEEP_ALIVE_INTERVAL = 30  # send keep-alive every 30 seconds
+# Stream GoPro -> S3 without staging chapters on local disk. Saves a full
+# write + read of every chapter on the Jetson's storage, at the cost of the
+# Range-resume the local download path provides.
+STREAM_DIRECT_TO_S3 = os.getenv('CHAPTER_STREAM_DIRECT', 'false').lower() == 'true'
+
+
+# One shared thread keeps every camera with an active download awake instead
+# of a sleeping thread per camera. Maps gopro_ip -> number of active holders.
+_keepalive_targets: Dict[str, int] = {}
+_keepalive_lock = threading.Lock()
+_keepalive_wake = threading.Event()
+_keepalive_thread = None
+_keepalive_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='gopro-keepalive')
+
+
+def _send_keep_alive(gopro_ip: str):
+    try:
+        requests.get(
+            f'http://{gopro_ip}:8080/gopro/camera/keep_alive',
+            timeout=2
+        )
+    except:
+        pass  # Silently ignore errors
+
+
+def _keepalive_loop():
+    """Ping all registered cameras concurrently every KEEP_ALIVE_INTERVAL."""
+    while True:
+        with _keepalive_lock:
+            targets = list(_keepalive_targets)
+        for gopro_ip in targets:
+            _keepalive_pool.submit(_send_keep_alive, gopro_ip)
+        # Woken early when a new camera registers so it is pinged right away
+        _keepalive_wake.wait(KEEP_ALIVE_INTERVAL)
+        _keepalive_wake.clear()
 
 
 class KeepAliveThread:
     """
-    Background thread to send keep-alive to GoPro during download.
+    Keep a GoPro awake during download.
     
     Prevents GoPro from sleeping during long downloads.
-    Based on proven logic from scripts/download_chapters.py.
+    Based on proven logic from scripts/download_chapters.py. Registers the
+    camera with a single process-wide keep-alive loop rather than running a
+    thread of its own.
     """
     
     def __init__(self, gopro_ip: str):
         self.gopro_ip = gopro_ip
         self.running = False
-        self.thread = None
     
     def start(self):
-        """Start the keep-alive background thread."""
+        """Register the camera with the shared keep-alive loop."""
+        global _keepalive_thread
+        if self.running:
+            return
         self.running = True
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
-        logger.debug(f"Keep-alive thread started for {self.gopro_ip}")
+        with _keepalive_lock:
+            _keepalive_targets[self.gopro_ip] = _keepalive_targets.get(self.gopro_ip, 0) + 1
+            if _keepalive_thread is None:
+                _keepalive_thread = threading.Thread(
+                    target=_keepalive_loop, name='gopro-keepalive', daemon=True
+                )
+                _keepalive_thread.start()
+        _keepalive_wake.set()
+        logger.debug(f"Keep-alive registered for {self.gopro_ip}")
     
     def stop(self):
-        """Stop the keep-alive background thread."""
+        """Unregister the camera from the shared keep-alive loop."""
+        if not self.running:
+            return
         self.running = False
-        if self.thread:
-            self.thread.join(timeout=2)
-        logger.debug(f"Keep-alive thread stopped for {self.gopro_ip}")
-    
-    def _run(self):
-        """Keep-alive loop - runs in background thread."""
-        while self.running:
-            try:
-                requests.get(
-                    f'http://{self.gopro_ip}:8080/gopro/camera/keep_alive',
-                    timeout=2
-                )
-            except:
-                pass  # Silently ignore errors
-            time.sleep(KEEP_ALIVE_INTERVAL)
+        with _keepalive_lock:
+            remaining = _keepalive_targets.get(self.gopro_ip, 0) - 1
+            if remaining > 0:
+                _keepalive_targets[self.gopro_ip] = remaining
+            else:
+                _keepalive_targets.pop(self.gopro_ip, None)
+        logger.debug(f"Keep-alive unregistered for {self.gopro_ip}")
+
+
+class SerializedS3Client:
+    """Runs every call on a shared boto3 S3 client under one lock.
+
+    The upload client is deliberately limited to one connection and no
+    transfer threads (concurrent TLS streams hit SSL EOF errors on the
+    Jetson). Camera workers that share it keep reading from their GoPros in
+    parallel but take turns on S3: upload_part/complete_multipart_upload
+    calls go out one at a time.
+    """
+
+    def __init__(self, s3_client, lock: Optional[threading.Lock] = None):
+        self._client = s3_client
+        self._lock = lock or threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._client, name)
+        if not callable(attr):
+            return attr
+
+        def call(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+        return call
 
 
 class ChapterUploadService:
@@ -515,7 +580,9 @@ class ChapterUploadService:
         parts = []
         part_number = 1
         total_bytes = 0
-        buffer = b''
+        # bytearray appends in place; `bytes += chunk` re-copied the whole
+        # pending part (up to S3_PART_SIZE) on every 256KB chunk
+        buffer = bytearray()
 
         try:
             # Stream from GoPro with timeouts
@@ -552,7 +619,7 @@ class ChapterUploadService:
                         Key=s3_key,
                         PartNumber=part_number,
                         UploadId=upload_id,
-                        Body=buffer
+                        Body=bytes(buffer)
                     )
                     parts.append({
                         'ETag': part_response['ETag'],
@@ -560,7 +627,7 @@ class ChapterUploadService:
                     })
                     logger.info(f"  Uploaded part {part_number} ({total_bytes / (1024**3):.2f} GB streamed)")
                     part_number += 1
-                    buffer = b''
+                    buffer.clear()
 
             # Upload remaining buffer (final part, can be < 5MB)
             if buffer:
@@ -569,7 +636,7 @@ class ChapterUploadService:
                     Key=s3_key,
                     PartNumber=part_number,
                     UploadId=upload_id,
-                    Body=buffer
+                    Body=bytes(buffer)
                 )
                 parts.append({
                     'ETag': part_response['ETag'],
@@ -663,6 +730,10 @@ class ChapterUploadService:
         1. Download chapter from GoPro to Jetson (/tmp/chapters/)
         2. Upload from Jetson to S3 (faster ethernet)
         3. Delete from Jetson local (keep on GoPro SD card)
+
+        With CHAPTER_STREAM_DIRECT=true, each chapter is instead streamed
+        straight from GoPro HTTP into an S3 multipart upload
+        (stream_chapter_to_s3) and never touches local disk.
         
         Uses robust download logic with:
         - Resume capability (Range headers)
@@ -763,6 +834,39 @@ class ChapterUploadService:
                             pass
                     continue
 
+                if STREAM_DIRECT_TO_S3:
+                    def stream_progress(bytes_uploaded, total_bytes):
+                        if progress_callback:
+                            try:
+                                progress_callback('uploading', chapter_num, total_chapters,
+                                                 results['total_bytes'] + bytes_uploaded)
+                            except Exception:
+                                pass
+
+                    stream_result = self.stream_chapter_to_s3(
+                        gopro_ip=gopro_ip,
+                        directory=directory,
+                        filename=filename,
+                        s3_key=s3_key,
+                        expected_size=expected_size,
+                        progress_callback=stream_progress
+                    )
+                    if stream_result['success']:
+                        results['chapters_uploaded'] += 1
+                        results['total_bytes'] += stream_result['bytes_uploaded']
+                        results['uploaded_chapters'].append({
+                            'filename': filename,
+                            's3_key': s3_key,
+                            'bytes': stream_result['bytes_uploaded']
+                        })
+                        logger.info(f"[{chapter_num}/{total_chapters}] STREAMED: {filename} -> s3://{self.bucket_name}/{s3_key}")
+                    else:
+                        results['success'] = False
+                        results['failed_chapters'].append(filename)
+                        results['errors'].append(f"Stream failed: {stream_result.get('error', 'Unknown error')}")
+                        logger.error(f"[{chapter_num}/{total_chapters}] STREAM FAILED: {filename} - {stream_result.get('error')}")
+                    continue
+
                 # Report progress: downloading
                 if progress_callback:
                     try:
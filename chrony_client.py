@@ -0,0 +1,155 @@
+"""Minimal chronyd command-socket client.
+
+``/api/system/ntp`` used to fork ``chronyc tracking`` and pick fields out of
+its human-readable output.  :func:`query_tracking` sends the same
+``REQ_TRACKING`` request chronyc does, straight to chronyd's command port
+(UDP 323 on localhost, which chronyd answers for monitoring commands
+without root), and unpacks the fixed-layout reply — no fork/exec, no pipe,
+no text parsing.
+
+Layouts follow chrony's ``candm.h`` (protocol version 6).  Anything
+unexpected — chronyd not running, a timeout, a short or mismatched reply —
+returns ``None`` so the caller can fall back to :func:`parse_tracking_output`
+on ``chronyc tracking``.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import socket
+import struct
+from typing import Optional
+
+CHRONYD_ADDRESS = ('127.0.0.1', 323)
+
+_PROTO_VERSION = 6
+_PKT_TYPE_CMD_REQUEST = 1
+_PKT_TYPE_CMD_REPLY = 2
+_REQ_TRACKING = 33
+_RPY_TRACKING = 5
+_STT_SUCCESS = 0
+
+_IPADDR_INET4 = 1
+_IPADDR_INET6 = 2
+
+# version, pkt_type, res1, res2, command, attempt, sequence, pad1, pad2
+_REQUEST_HEADER = struct.Struct('>BBBBHHIII')
+# version, pkt_type, res1, res2, command, reply, status, pad1-3, sequence, pad4-5
+_REPLY_HEADER = struct.Struct('>BBBBHHHHHHIII')
+# ref_id, ip_addr (16 bytes + family + pad), stratum, leap_status,
+# ref_time (3 x u32), then nine chrony Floats: current_correction,
+# last_offset, rms_offset, freq_ppm, resid_freq_ppm, skew_ppm, root_delay,
+# root_dispersion, last_update_interval
+_TRACKING = struct.Struct('>I16sHHHHIII9I')
+
+# chronyd drops requests shorter than the reply they ask for (so it can't be
+# used as a traffic amplifier); pad with zeros up to the tracking reply size
+_REQUEST_LENGTH = _REPLY_HEADER.size + _TRACKING.size
+
+_LEAP_NAMES = ('Normal', 'Insert second', 'Delete second', 'Not synchronised')
+
+
+def _decode_float(value: int) -> float:
+    """Decode chrony's 32-bit network float (7-bit exponent, 25-bit coefficient)."""
+    exp = value >> 25
+    if exp >= 1 << 6:
+        exp -= 1 << 7
+    coef = value & ((1 << 25) - 1)
+    if coef >= 1 << 24:
+        coef -= 1 << 25
+    return coef * 2.0 ** (exp - 25)
+
+
+def _format_source(ref_id: int, addr: bytes, family: int) -> str:
+    if family == _IPADDR_INET4:
+        return socket.inet_ntop(socket.AF_INET, addr[:4])
+    if family == _IPADDR_INET6:
+        return socket.inet_ntop(socket.AF_INET6, addr)
+    # Reference clocks (GPS, PPS, ...) have no address; chronyc shows the
+    # refid as text
+    return ref_id.to_bytes(4, 'big').rstrip(b'\0').decode('ascii', 'replace')
+
+
+def parse_tracking_reply(packet: bytes, sequence: int) -> Optional[dict]:
+    """Unpack a ``RPY_TRACKING`` packet into the ``/api/system/ntp`` fields."""
+    if len(packet) < _REQUEST_LENGTH:
+        return None
+    (version, pkt_type, _, _, command, reply, status,
+     _, _, _, seq, _, _) = _REPLY_HEADER.unpack_from(packet)
+    if (version != _PROTO_VERSION or pkt_type != _PKT_TYPE_CMD_REPLY
+            or command != _REQ_TRACKING or reply != _RPY_TRACKING
+            or status != _STT_SUCCESS or seq != sequence):
+        return None
+    fields = _TRACKING.unpack_from(packet, _REPLY_HEADER.size)
+    ref_id, addr, family, _, stratum, leap = fields[:6]
+    current_correction = _decode_float(fields[9])
+    return {
+        'synced': leap == 0,
+        'leap_status': _LEAP_NAMES[leap] if leap < len(_LEAP_NAMES) else None,
+        # chronyc prints the magnitude ("N seconds fast/slow of NTP time")
+        'offset_ms': round(abs(current_correction) * 1000, 3),
+        'stratum': stratum,
+        'source': _format_source(ref_id, addr, family),
+    }
+
+
+def query_tracking(address=CHRONYD_ADDRESS, timeout: float = 1.0) -> Optional[dict]:
+    """Ask chronyd for its tracking state; None if it can't be reached."""
+    sequence = int.from_bytes(os.urandom(4), 'big')
+    request = _REQUEST_HEADER.pack(
+        _PROTO_VERSION, _PKT_TYPE_CMD_REQUEST, 0, 0, _REQ_TRACKING, 0, sequence, 0, 0)
+    request = request.ljust(_REQUEST_LENGTH, b'\0')
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(address)
+            sock.send(request)
+            packet = sock.recv(1024)
+    except OSError:
+        return None
+    return parse_tracking_reply(packet, sequence)
+
+
+def _parse_source(result: dict, value: str) -> None:
+    # "C0A80001 (time.example.com)" -> the name in parentheses
+    match = _PAREN_RE.search(value)
+    result['source'] = match.group(1) if match else value.split()[0]
+
+
+def _parse_stratum(result: dict, value: str) -> None:
+    if value.isdigit():
+        result['stratum'] = int(value)
+
+
+def _parse_system_time(result: dict, value: str) -> None:
+    # "0.000012345 seconds fast of NTP time"
+    try:
+        result['offset_ms'] = round(float(value.split()[0]) * 1000, 3)
+    except ValueError:
+        pass
+
+
+def _parse_leap_status(result: dict, value: str) -> None:
+    result['leap_status'] = value
+    result['synced'] = value.lower() == 'normal'
+
+
+_TRACKING_FIELD_HANDLERS = {
+    'Reference ID': _parse_source,
+    'Stratum': _parse_stratum,
+    'System time': _parse_system_time,
+    'Leap status': _parse_leap_status,
+}
+# One scan over the whole output picks out just the lines we use
+_TRACKING_FIELD_RE = re.compile(
+    r'^(%s)\s*:\s*(\S.*?)\s*$' % '|'.join(_TRACKING_FIELD_HANDLERS), re.M)
+_PAREN_RE = re.compile(r'\(([^)]*)\)')
+
+
+def parse_tracking_output(output: str) -> dict:
+    """Parse ``chronyc tracking`` text into the same fields as :func:`query_tracking`."""
+    result = {'synced': False, 'offset_ms': None, 'stratum': None, 'source': None}
+    for match in _TRACKING_FIELD_RE.finditer(output):
+        _TRACKING_FIELD_HANDLERS[match.group(1)](result, match.group(2))
+    return result
@@ -29,13 +29,53 @@ Document Structure:
 }
 """
 
+import copy
 import os
 import json
-from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from typing import Optional, List, Dict, Any, Callable, Iterator
 
 import firebase_admin
 from firebase_admin import credentials, firestore
+from google.api_core.exceptions import FailedPrecondition
+
+from session_overlap import SessionOverlapIndex, to_epoch
+
+
+class TimedCache:
+    """Small thread-safe TTL cache with explicit invalidation."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._entries: Dict[Any, tuple] = {}  # key -> (expires_at, value)
+        self._generation = 0  # bumped on invalidate
+        self._lock = threading.Lock()
+
+    def get_or_fetch(self, key, fetch: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling fetch() if missing or expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] > now:
+                return entry[1]
+            generation = self._generation
+        value = fetch()
+        with self._lock:
+            # Don't store a result fetched across an invalidation; it may
+            # predate the write that triggered it
+            if generation == self._generation:
+                self._entries[key] = (now + self.ttl, value)
+        return value
+
+    def invalidate(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
 
 
 class FirebaseService:
@@ -44,6 +84,28 @@ class FirebaseService:
     RECORDING_SESSIONS_COLLECTION = 'recording-sessions'
     BASKETBALL_GAMES_COLLECTION = 'basketball-games'
 
+    # Recording start/stop writes are committed by one background thread in
+    # WriteBatches of up to WRITE_BATCH_MAX ops, gathered for at most
+    # WRITE_BATCH_WAIT seconds after the first op arrives.
+    WRITE_BATCH_MAX = 20
+    WRITE_BATCH_WAIT = 0.1
+    # How long start/stop wait for their queued write to commit
+    WRITE_TIMEOUT = 60
+
+    # Session list queries are memoized briefly: stop-all, status polls and
+    # pipeline start all ask for the same lists within a few seconds. Every
+    # recording-sessions write below invalidates the cache.
+    SESSIONS_CACHE_TTL = 2.0
+
+    # Overlap lookups only fetch sessions that started at most this long
+    # before the range start (no recording runs longer), a page at a time.
+    MAX_SESSION_HOURS = 24
+    OVERLAP_PAGE_SIZE = 500
+
+    # Session lists are fetched this many documents per request, continuing
+    # from a cursor, so readers that stop early skip the remaining pages.
+    SESSION_PAGE_SIZE = 50
+
     def __init__(self, credentials_path: Optional[str] = None):
         """
         Initialize Firebase Admin SDK.
@@ -78,6 +140,53 @@ class FirebaseService:
 
         self.db = firestore.client()
 
+        self._sessions_cache = TimedCache(self.SESSIONS_CACHE_TTL)
+        self._stopped_index_missing = False
+        self._write_queue = queue.Queue()
+        threading.Thread(target=self._flush_writes, name='firebase-writes', daemon=True).start()
+
+    def _enqueue_write(self, op: str, doc_ref, data: dict) -> Future:
+        """Queue a set/update for the batch writer; the Future resolves on commit."""
+        future = Future()
+        self._sessions_cache.invalidate()
+        self._write_queue.put((op, doc_ref, data, future))
+        return future
+
+    def _flush_writes(self) -> None:
+        """Background writer: drain queued ops and commit them as WriteBatches."""
+        while True:
+            items = [self._write_queue.get()]
+            deadline = time.monotonic() + self.WRITE_BATCH_WAIT
+            while len(items) < self.WRITE_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._write_queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                batch = self.db.batch()
+                for op, doc_ref, data, _ in items:
+                    getattr(batch, op)(doc_ref, data)
+                batch.commit()
+                for *_, future in items:
+                    future.set_result(None)
+            except Exception:
+                # A batch is all-or-nothing; retry one by one so a single bad
+                # op (e.g. update of a missing doc) doesn't fail the others.
+                for op, doc_ref, data, future in items:
+                    try:
+                        getattr(doc_ref, op)(data)
+                        future.set_result(None)
+                    except Exception as e:
+                        print(f"⚠ Firebase {op} failed for {doc_ref.id}: {e}")
+                        future.set_exception(e)
+            # Reads made while these writes were queued may have cached the
+            # pre-write state
+            self._sessions_cache.invalidate()
+
     # Only these four session/angle types are supported; no UNKNOWN in UI.
     VALID_ANGLE_CODES = ('FL', 'FR', 'NL', 'NR')
 
@@ -117,6 +226,11 @@ class FirebaseService:
 
         Returns:
             Document ID of the created recording session
+
+        The write is committed by the background batch writer (so starts on
+        several cameras share one commit), but this waits for it: callers keep
+        the returned ID for the stop update, so it must not name a document
+        that was never created. Raises if the write fails or times out.
         """
         camera_name = session_data.get('camera_name', 'Unknown Camera')
         segment_session = session_data.get('segment_session', '')
@@ -136,9 +250,9 @@ class FirebaseService:
             'processedGames': []
         }
 
-        doc_ref = self.db.collection(self.RECORDING_SESSIONS_COLLECTION).add(doc_data)
-        # .add() returns a tuple of (update_time, doc_ref)
-        return doc_ref[1].id
+        doc_ref = self.db.collection(self.RECORDING_SESSIONS_COLLECTION).document()
+        self._enqueue_write('set', doc_ref, doc_data).result(timeout=self.WRITE_TIMEOUT)
+        return doc_ref.id
 
     def register_recording_stop(self, session_id: str, stop_data: dict) -> None:
         """
@@ -165,7 +279,9 @@ class FirebaseService:
         if chapter_files:
             update_data['chapterFiles'] = chapter_files
 
-        doc_ref.update(update_data)
+        # Goes through the same queue as the start write so it can never
+        # overtake it; wait so callers still see failures.
+        self._enqueue_write('update', doc_ref, update_data).result(timeout=self.WRITE_TIMEOUT)
 
     def update_session_status(self, session_id: str, status: str) -> None:
         """
@@ -177,6 +293,7 @@ class FirebaseService:
         """
         doc_ref = self.db.collection(self.RECORDING_SESSIONS_COLLECTION).document(session_id)
         doc_ref.update({'status': status})
+        self._sessions_cache.invalidate()
 
     def add_processed_game(self, session_id: str, game_data: dict) -> None:
         """
@@ -203,6 +320,7 @@ class FirebaseService:
         doc_ref.update({
             'processedGames': firestore.ArrayUnion([processed_game])
         })
+        self._sessions_cache.invalidate()
 
     def _to_utc_iso(self, dt: datetime) -> str:
         """Return datetime as ISO 8601 UTC string (e.g. 2026-02-02T14:09:46.000Z) for Firestore."""
@@ -268,20 +386,148 @@ class FirebaseService:
         Returns:
             List of recording session documents
         """
-        sessions_ref = self.db.collection(self.RECORDING_SESSIONS_COLLECTION)
+        sessions = self._sessions_cache.get_or_fetch(
+            ('recording_sessions', jetson_id, limit),
+            lambda: self._query_recording_sessions(jetson_id, limit)
+        )
+        # Deep copies: documents hold nested lists/dicts (processedGames, ...)
+        # that callers must not be able to mutate in the cache
+        return [copy.deepcopy(session) for session in sessions]
+
+    def _query_recording_sessions(self, jetson_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        return list(self.iter_recording_sessions(jetson_id=jetson_id, limit=limit))
+
+    def get_sessions_overlapping(self, start, end=None,
+                                 jetson_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Get recording sessions whose time range overlaps [start, end).
 
-        query = sessions_ref.order_by('startedAt', direction=firestore.Query.DESCENDING).limit(limit)
+        Firestore only returns sessions that started inside the window
+        [start - MAX_SESSION_HOURS, end), paged with a cursor, so there is
+        no fixed cap on how many sessions are considered. The exact overlap
+        check (which also needs endedAt) runs on an index that parses each
+        session's timestamps once per cached query.
 
+        Args:
+            start: Range start (ISO 8601 string or datetime)
+            end: Range end; None means now (e.g. a game still in progress)
+            jetson_id: Filter by specific Jetson ID (None for all Jetsons)
+
+        Returns:
+            Overlapping recording session documents, newest first
+        """
+        start_ts = to_epoch(start)
+        end_ts = to_epoch(end) if end is not None else None
+        if start_ts is None or (end is not None and end_ts is None):
+            raise ValueError(f'unparseable time range: {start!r} - {end!r}')
+
+        lower_iso = self._to_utc_iso(
+            datetime.fromtimestamp(start_ts, timezone.utc) - timedelta(hours=self.MAX_SESSION_HOURS)
+        )
+        upper_iso = self._to_utc_iso(datetime.fromtimestamp(end_ts, timezone.utc)) if end_ts is not None else None
+
+        index = self._sessions_cache.get_or_fetch(
+            ('session_overlap_index', jetson_id, lower_iso, upper_iso),
+            lambda: SessionOverlapIndex(self._query_sessions_started_between(lower_iso, upper_iso, jetson_id))
+        )
+        return [copy.deepcopy(session) for session in index.overlapping(start_ts, end_ts)]
+
+    def _query_sessions_started_between(self, lower_iso: str, upper_iso: Optional[str],
+                                        jetson_id: Optional[str]) -> List[Dict[str, Any]]:
+        query = self.db.collection(self.RECORDING_SESSIONS_COLLECTION).where('startedAt', '>=', lower_iso)
+        if upper_iso:
+            query = query.where('startedAt', '<', upper_iso)
         if jetson_id:
             query = query.where('jetsonId', '==', jetson_id)
+        query = query.order_by('startedAt', direction=firestore.Query.DESCENDING)
+        return list(self._stream_pages(query, self.OVERLAP_PAGE_SIZE))
 
-        sessions = []
-        for doc in query.stream():
-            session_data = doc.to_dict()
-            session_data['id'] = doc.id
-            sessions.append(session_data)
+    def _stream_pages(self, query, page_size: int, limit: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yield a query's documents as dicts (with 'id'), one page at a time.
+
+        Each page is a separate request continuing after the last document
+        of the previous one, so a caller that stops early never pays for the
+        pages it didn't reach.
+        """
+        yielded = 0
+        page = query
+        while limit is None or yielded < limit:
+            size = page_size if limit is None else min(page_size, limit - yielded)
+            docs = list(page.limit(size).stream())
+            for doc in docs:
+                session_data = doc.to_dict()
+                session_data['id'] = doc.id
+                yield session_data
+            yielded += len(docs)
+            if len(docs) < size:
+                return
+            page = query.start_after(docs[-1])
+
+    def get_stopped_sessions(self, jetson_id: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """
+        Get the most recent stopped recording sessions.
+
+        Filters on status server-side, so only candidate sessions for the
+        pipeline are transferred. That needs a composite index on
+        (jetsonId, status, startedAt desc); until it exists, falls back to
+        get_recording_sessions() filtered in Python.
 
-        return sessions
+        Args:
+            jetson_id: Filter by specific Jetson ID
+            limit: Maximum number of sessions to return
+
+        Returns:
+            List of stopped recording session documents, newest first
+        """
+        sessions = self._sessions_cache.get_or_fetch(
+            ('stopped_sessions', jetson_id, limit),
+            lambda: self._query_stopped_sessions(jetson_id, limit)
+        )
+        return [copy.deepcopy(session) for session in sessions]
+
+    def _query_stopped_sessions(self, jetson_id: Optional[str], limit: int) -> List[Dict[str, Any]]:
+        if not self._stopped_index_missing:
+            query = (
+                self.db.collection(self.RECORDING_SESSIONS_COLLECTION)
+                .where('status', '==', 'stopped')
+                .order_by('startedAt', direction=firestore.Query.DESCENDING)
+                .limit(limit)
+            )
+            if jetson_id:
+                query = query.where('jetsonId', '==', jetson_id)
+            try:
+                sessions = []
+                for doc in query.stream():
+                    session_data = doc.to_dict()
+                    session_data['id'] = doc.id
+                    sessions.append(session_data)
+                return sessions
+            except FailedPrecondition as e:
+                self._stopped_index_missing = True
+                print(f"⚠ Stopped-sessions index missing, filtering client-side: {e}")
+
+        return [
+            session for session in self._query_recording_sessions(jetson_id, limit)
+            if session.get('status') == 'stopped'
+        ]
+
+    def iter_recording_sessions(self, jetson_id: Optional[str] = None, limit: int = 50) -> Iterator[Dict[str, Any]]:
+        """
+        Yield recording sessions one at a time as Firestore streams them.
+
+        Same query as get_recording_sessions, but uncached and fetched
+        SESSION_PAGE_SIZE documents at a time, so a caller can forward each
+        session before the rest have arrived or stop without reading them.
+        """
+        sessions_ref = self.db.collection(self.RECORDING_SESSIONS_COLLECTION)
+
+        query = sessions_ref.order_by('startedAt', direction=firestore.Query.DESCENDING)
+
+        if jetson_id:
+            query = query.where('jetsonId', '==', jetson_id)
+
+        yield from self._stream_pages(query, self.SESSION_PAGE_SIZE, limit)
 
     def get_recording_session(self, session_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -749,6 +995,7 @@ class FirebaseService:
                     except Exception as e:
                         log.error(f"Failed to migrate session {doc.id}: {e}")
             if count:
+                self._sessions_cache.invalidate()
                 log.info(f"Startup migration: updated {count} legacy session(s) to 'uploaded'")
             return count
         except Exception as e:
@@ -771,6 +1018,7 @@ class FirebaseService:
             's3UploadedAt': datetime.utcnow().isoformat() + 'Z',
             'status': 'uploaded'
         })
+        self._sessions_cache.invalidate()
 
     def get_sessions_pending_upload(self, jetson_id: Optional[str] = None) -> List[Dict[str, Any]]:
         """
@@ -786,6 +1034,13 @@ class FirebaseService:
         Returns:
             List of session documents pending upload
         """
+        sessions = self._sessions_cache.get_or_fetch(
+            ('pending_upload', jetson_id),
+            lambda: self._query_sessions_pending_upload(jetson_id)
+        )
+        return [copy.deepcopy(session) for session in sessions]
+
+    def _query_sessions_pending_upload(self, jetson_id: Optional[str]) -> List[Dict[str, Any]]:
         sessions_ref = self.db.collection(self.RECORDING_SESSIONS_COLLECTION)
 
         # Query for stopped sessions
@@ -0,0 +1,38 @@
+"""
+Gunicorn configuration for the GoPro Controller API.
+
+Usage:
+    gunicorn -c gunicorn.conf.py main:app
+
+A single worker process is required: recording state, job tables and the
+pipeline orchestrator all live in main.py's module globals, so a second
+worker would see (and act on) a different copy of that state. Concurrency
+comes from the gthread pool instead.
+
+The GoPro proxy endpoints (download/stream/thumbnail) hold a thread for the
+whole transfer while they wait on the camera, so the pool is sized for a few
+long streams plus dashboard polling. Set GUNICORN_THREADS to tune it.
+"""
+
+import os
+
+bind = '0.0.0.0:5000'
+
+workers = 1
+worker_class = 'gthread'
+# Matches main._gopro_session's pool_maxsize, so every proxy thread can
+# hold its own keep-alive connection to a camera
+threads = int(os.environ.get('GUNICORN_THREADS', '32'))
+
+# Keep connections from the dashboard/tunnel open between polls
+keepalive = 30
+
+# Long enough for multi-GB video downloads and GoPro proxy streams
+timeout = 600
+graceful_timeout = 30
+
+
+def post_worker_init(worker):
+    """Run the same startup cleanup/recovery as `python main.py`."""
+    import main
+    main.run_startup_tasks()
@@ -5,11 +5,13 @@ Provides file-based logging with rotation and live streaming capabilities.
 
 import os
 import sys
+import atexit
+import queue
 import logging
 import threading
 from datetime import datetime
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 from collections import deque
 from typing import Optional, Generator
 import time
@@ -146,19 +148,31 @@ class LoggingService:
         )
         file_handler.setLevel(logging.DEBUG)
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
 
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(logging.INFO)
         console_handler.setFormatter(formatter)
-        root_logger.addHandler(console_handler)
 
         # Buffer handler for live streaming
         buffer_handler = BufferedHandler(log_buffer)
         buffer_handler.setLevel(logging.DEBUG)
         buffer_handler.setFormatter(formatter)
-        root_logger.addHandler(buffer_handler)
+
+        # Request threads only enqueue records; a single listener thread does
+        # the file/console/buffer writes so logging never blocks on disk or
+        # stdout (e.g. under systemd with PYTHONUNBUFFERED=1).
+        log_queue = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        self._listener = QueueListener(
+            log_queue,
+            file_handler,
+            console_handler,
+            buffer_handler,
+            respect_handler_level=True
+        )
+        self._listener.start()
+        atexit.register(self._listener.stop)
 
         # Store reference
         self.logger = root_logger
@@ -13,29 +13,104 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from flask import Flask, jsonify, request, send_file, Response, send_from_directory
-from flask_cors import CORS
+from flask.json.provider import DefaultJSONProvider
 import subprocess
 import threading
+import logging
+import socket
+import fcntl
+import struct
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import os
 import time
 import json
-from datetime import datetime, timedelta
+import heapq
+from operator import itemgetter
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from urllib.parse import quote
 import requests
+from requests.adapters import HTTPAdapter
+import boto3
+from botocore.config import Config as BotoConfig
 import re
+try:
+    import orjson
+except ImportError:
+    orjson = None
+_json_loads = orjson.loads if orjson else json.loads
 from videoupload import VideoUploadService
 from media_service import get_media_service
 from logging_service import get_logging_service, get_logger
 from firebase_service import get_firebase_service
 from uball_client import get_uball_client
 from video_processing import VideoProcessor, process_game_videos
+from chrony_client import query_tracking, parse_tracking_output
+from session_overlap import parse_iso8601
+from pipeline_orchestrator import init_orchestrator, get_orchestrator
 
 # Initialize logging service first
 logging_service = get_logging_service()
 logger = get_logger('gopro.main')
 
+
+class OrjsonProvider(DefaultJSONProvider):
+    """jsonify() and request.get_json() via orjson: same output as Flask's
+    default provider (sorted keys, HTTP-date datetimes, etc. via its default
+    hook), serialized and parsed in C."""
+
+    def _dump_bytes(self, obj, option=0, **kwargs):
+        option |= orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=kwargs.get('default', self.default), option=option)
+
+    def dumps(self, obj, **kwargs):
+        return self._dump_bytes(obj, **kwargs).decode()
+
+    def loads(self, s, **kwargs):
+        # request.get_json() bodies; orjson.JSONDecodeError is a ValueError,
+        # so malformed JSON still becomes Flask's 400
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        # jsonify() path: hand orjson's bytes (with the trailing newline
+        # Flask adds) straight to the response instead of decoding to str
+        # and re-encoding, which matters for the large list endpoints
+        obj = self._prepare_response_obj(args, kwargs)
+        indent = (self.compact is None and self.app.debug) or self.compact is False
+        body = self._dump_bytes(obj, orjson.OPT_APPEND_NEWLINE, indent=indent)
+        return self.app.response_class(body, mimetype=self.mimetype)
+
+
 app = Flask(__name__)
-CORS(app, resources={r"/*": {"origins": "*", "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"], "allow_headers": ["Content-Type", "Authorization"]}})
+if orjson:
+    app.json = OrjsonProvider(app)
+
+# CORS: every route is open to any origin, so the headers never vary per
+# request. Answer preflights before view dispatch and stamp the same static
+# headers on everything else, instead of running flask_cors' per-request
+# resource matching.
+CORS_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, PUT, DELETE, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type, Authorization',
+}
+
+
+@app.before_request
+def _cors_preflight():
+    if request.method == 'OPTIONS':
+        return '', 204, CORS_HEADERS
+
+
+@app.after_request
+def _add_cors_headers(response):
+    response.headers.update(CORS_HEADERS)
+    return response
+
 
 # Register Z-CAM Blueprint (self-contained Z-CAM streaming pipeline)
 try:
@@ -50,6 +125,7 @@ VIDEO_STORAGE_DIR = os.path.expanduser('~/gopro_videos')
 SEGMENTS_DIR = os.path.join(VIDEO_STORAGE_DIR, 'segments')
 os.makedirs(VIDEO_STORAGE_DIR, exist_ok=True)
 os.makedirs(SEGMENTS_DIR, exist_ok=True)
+_VIDEO_ROOT = Path(VIDEO_STORAGE_DIR).resolve()
 
 # Upload configuration
 UPLOAD_ENABLED = os.getenv('UPLOAD_ENABLED', 'true').lower() == 'true'
@@ -98,50 +174,83 @@ print(f"✓ Video processor initialized (output: {video_processor.output_dir})")
 
 # Global state
 recording_processes = {}
-recording_lock = threading.Lock()
+# Condition so waiters (e.g. stop-all's pipeline monitor) are notified when
+# entries are removed instead of polling; use as a plain lock everywhere else.
+recording_lock = threading.Condition()
 gopro_ip_cache = {}
+# interface -> time.monotonic() the cached IP last answered; within
+# GOPRO_IP_VERIFIED_TTL get_gopro_wired_ip trusts it without re-probing
+GOPRO_IP_VERIFIED_TTL = 30
+_gopro_ip_verified_at = {}
+
+
+def _remember_gopro_ip(interface, gopro_ip):
+    """Record that gopro_ip just answered on interface"""
+    gopro_ip_cache[interface] = gopro_ip
+    _gopro_ip_verified_at[interface] = time.monotonic()
+
+def _forget_gopro_ip_verification(interface):
+    """Make the next get_gopro_wired_ip(interface) re-probe the cached IP"""
+    _gopro_ip_verified_at.pop(interface, None)
+
+# Shared pool for short, concurrent GoPro HTTP probes (discovery, state checks)
+_gopro_probe_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix='gopro-probe')
+
+# Small pool for Uball round trips that can run side by side within one
+# request
+_bg_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='bg-io')
+
+# Pooled keep-alive HTTP session for GoPro API calls, so repeated state
+# checks / stop / download requests to the same camera reuse one TCP
+# connection instead of reconnecting every time.
+_gopro_session = requests.Session()
+_gopro_session.mount('http://', HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0))
 
 # Video processing jobs (async)
 import uuid
-video_processing_jobs = {}  # job_id -> job_state
+# job_id -> job_state. Job dicts are never mutated once stored: updates go
+# through _update_video_job, which swaps in a new dict under the lock, so
+# status readers can fetch a job without locking and never see a half-update.
+video_processing_jobs = {}
 video_processing_lock = threading.Lock()
 
-# Download configuration - optimized for GoPro USB connections
-DOWNLOAD_CHUNK_SIZE = 262144  # 256KB - smaller chunks for faster stall detection
-DOWNLOAD_CONNECT_TIMEOUT = 10  # seconds to establish connection
-DOWNLOAD_READ_TIMEOUT = 60  # seconds to wait for data between chunks
-DOWNLOAD_MAX_RETRIES = 20  # more retries, never delete partial files
-DOWNLOAD_KEEP_ALIVE_INTERVAL = 30  # send keep-alive every 30 seconds
+# Finished jobs are kept for status polls for a day, and at most this many
+# jobs are kept overall (oldest finished ones go first; running jobs stay)
+VIDEO_JOB_RETENTION = timedelta(hours=24)
+VIDEO_JOB_MAX = 512
 
 
-class DownloadKeepAliveThread:
-    """Background thread to send keep-alive to GoPro during download"""
+def _update_video_job(job_id, **fields):
+    """Replace a video processing job with a copy carrying the given fields"""
+    with video_processing_lock:
+        job = video_processing_jobs.get(job_id)
+        if job is not None:
+            video_processing_jobs[job_id] = {**job, **fields}
 
-    def __init__(self, gopro_ip):
-        self.gopro_ip = gopro_ip
-        self.running = False
-        self.thread = None
 
-    def start(self):
-        self.running = True
-        self.thread = threading.Thread(target=self._run, daemon=True)
-        self.thread.start()
+def _add_video_job(job):
+    """Store a new video processing job, pruning expired and excess finished jobs"""
+    cutoff = (datetime.now() - VIDEO_JOB_RETENTION).isoformat()
+    with video_processing_lock:
+        # Dict order is creation order (updates replace values in place), so
+        # walk oldest first
+        finished = [jid for jid, j in video_processing_jobs.items() if j.get('completed_at')]
+        excess = len(video_processing_jobs) + 1 - VIDEO_JOB_MAX
+        for jid in finished:
+            if excess > 0 or video_processing_jobs[jid]['completed_at'] < cutoff:
+                del video_processing_jobs[jid]
+                excess -= 1
+        video_processing_jobs[job['job_id']] = job
 
-    def stop(self):
-        self.running = False
-        if self.thread:
-            self.thread.join(timeout=2)
+# Download configuration - optimized for GoPro USB connections
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024  # 1MB per read when proxying camera media
+DOWNLOAD_CONNECT_TIMEOUT = 10  # seconds to establish connection
+DOWNLOAD_READ_TIMEOUT = 60  # seconds to wait for data between chunks
+DOWNLOAD_MAX_RETRIES = 20  # more retries, never delete partial files
 
-    def _run(self):
-        while self.running:
-            try:
-                requests.get(
-                    f'http://{self.gopro_ip}:8080/gopro/camera/keep_alive',
-                    timeout=2
-                )
-            except:
-                pass
-            time.sleep(DOWNLOAD_KEEP_ALIVE_INTERVAL)
+# When the API runs behind nginx, local video downloads/streams can be handed
+# off with X-Accel-Redirect (e.g. '/internal/videos/'). Empty = serve from Flask.
+VIDEO_ACCEL_REDIRECT_PREFIX = os.getenv('VIDEO_ACCEL_REDIRECT_PREFIX', '')
 
 # Admin Console jobs (shell script execution)
 import selectors
@@ -154,44 +263,45 @@ admin_device_locks_lock = threading.Lock()
 # Regex to strip ANSI escape codes and carriage returns from shell output
 _ansi_re = re.compile(r'\x1b\[[0-9;]*[a-zA-Z]|\r')
 
-def verify_video_integrity(file_path):
-    """
-    Quick check that video file is valid using ffprobe.
-    Returns True if file appears to be a valid video.
-    A timeout is treated as valid (not corrupted) since large 4K files
-    on a loaded Jetson can exceed probe time without being corrupt.
-    """
+
+def _strip_ansi(text):
+    """Strip ANSI codes/CRs, skipping the regex for the common clean line."""
+    if '\x1b' in text or '\r' in text:
+        return _ansi_re.sub('', text)
+    return text
+
+
+def _probe_gopro(gopro_ip, timeout=1):
+    """Return gopro_ip if a camera answers on it, else None"""
     try:
-        result = subprocess.run(
-            ['ffprobe', '-v', 'error', '-select_streams', 'v:0',
-             '-show_entries', 'stream=duration', '-of', 'csv=p=0', file_path],
-            capture_output=True,
-            text=True,
-            timeout=120
+        response = _gopro_session.get(
+            f'http://{gopro_ip}:8080/gopro/camera/state',
+            timeout=timeout
         )
-        # Check return code and that we got some duration output
-        if result.returncode == 0 and result.stdout.strip():
-            duration = float(result.stdout.strip())
-            if duration > 0:
-                return True
-        return False
-    except subprocess.TimeoutExpired:
-        logger.warning(f"ffprobe timeout checking {file_path} — assuming valid (large 4K file on loaded system)")
-        return True
-    except Exception as e:
-        logger.warning(f"ffprobe error checking {file_path}: {e}")
-        return False
+        if response.status_code == 200:
+            return gopro_ip
+    except Exception:
+        pass
+    return None
 
+# interface -> (our_ip, gopro_ip, monotonic time) of the last successful probe
+GOPRO_DISCOVERY_TTL = 30  # seconds
+_gopro_discovery_cache = {}
 
 def discover_gopro_ip_for_interface(interface, our_ip):
     """Discover the GoPro's IP address on a specific interface"""
+    # The enx* interface disappears when the camera is unplugged, so a recent
+    # hit for the same interface/address pair can skip the probe entirely
+    cached = _gopro_discovery_cache.get(interface)
+    if cached and cached[0] == our_ip and time.monotonic() - cached[2] < GOPRO_DISCOVERY_TTL:
+        return cached[1]
+
     try:
-        match = re.search(r'(\d+\.\d+\.\d+)\.(\d+)', our_ip)
-        if not match:
+        base, sep, last_octet = our_ip.rpartition('.')
+        if not sep or not last_octet.isdigit():
             return None
-        
-        base = match.group(1)
-        our_last = int(match.group(2))
+
+        our_last = int(last_octet)
         
         candidates = []
         if our_last == 50:
@@ -202,73 +312,152 @@ def discover_gopro_ip_for_interface(interface, our_ip):
             candidates = [f"{base}.51", f"{base}.50", f"{base}.1"]
         
         candidates = [ip for ip in candidates if ip != our_ip]
-        
-        for gopro_ip in candidates:
-            try:
-                response = requests.get(
-                    f'http://{gopro_ip}:8080/gopro/camera/state',
-                    timeout=1
-                )
-                if response.status_code == 200:
-                    print(f"✓ Discovered GoPro at {gopro_ip} on {interface}")
+
+        # Probe all candidates at once and take the first camera that answers,
+        # instead of paying up to 1s per dead candidate in sequence.
+        futures = [_gopro_probe_pool.submit(_probe_gopro, ip) for ip in candidates]
+        try:
+            for future in as_completed(futures):
+                gopro_ip = future.result()
+                if gopro_ip:
+                    logger.debug("✓ Discovered GoPro at %s on %s", gopro_ip, interface)
+                    _gopro_discovery_cache[interface] = (our_ip, gopro_ip, time.monotonic())
                     return gopro_ip
-            except:
-                pass
-        
+        finally:
+            for future in futures:
+                future.cancel()
+
+        _gopro_discovery_cache.pop(interface, None)
         return None
     except Exception as e:
-        print(f"Error discovering GoPro IP on {interface}: {e}")
+        logger.warning(f"Error discovering GoPro IP on {interface}: {e}")
         return None
 
-def get_connected_gopros():
+# get_connected_gopros() result cache. Discovery looks up interfaces and
+# probes every camera over HTTP, so UI status polls reuse the last result for
+# a few seconds; start/stop invalidate it because is_recording changes.
+# _gopros_scan_lock serializes scans so concurrent pollers share one;
+# _gopros_cache_lock only guards the cached value and is never held across a
+# scan, so invalidating never waits on a slow camera. A scan that started
+# before an invalidation (generation bump) is returned but not stored.
+GOPROS_CACHE_TTL = 3.0  # seconds
+_gopros_cache = {'ts': 0.0, 'gopros': None, 'generation': 0}
+_gopros_cache_lock = threading.Lock()
+_gopros_scan_lock = threading.Lock()
+
+
+def invalidate_gopros_cache():
+    """Force the next get_connected_gopros() call to rediscover"""
+    with _gopros_cache_lock:
+        _gopros_cache['gopros'] = None
+        _gopros_cache['generation'] += 1
+
+
+def _fresh_cached_gopros():
+    """The cached discovery result if still within GOPROS_CACHE_TTL, else None"""
+    with _gopros_cache_lock:
+        cached = _gopros_cache['gopros']
+        if cached is not None and time.monotonic() - _gopros_cache['ts'] < GOPROS_CACHE_TTL:
+            return cached
+    return None
+
+
+def get_connected_gopros(use_cache=True):
+    """Discover all connected GoPro cameras (cached for GOPROS_CACHE_TTL)"""
+    gopros = _fresh_cached_gopros() if use_cache else None
+    if gopros is None:
+        with _gopros_scan_lock:
+            # Another poller may have finished a scan while we waited
+            gopros = _fresh_cached_gopros() if use_cache else None
+            if gopros is None:
+                with _gopros_cache_lock:
+                    generation = _gopros_cache['generation']
+                gopros = _discover_connected_gopros()
+                with _gopros_cache_lock:
+                    if generation == _gopros_cache['generation']:
+                        _gopros_cache['gopros'] = gopros
+                        _gopros_cache['ts'] = time.monotonic()
+    return [dict(g) for g in gopros]
+
+
+# One match per USB-Ethernet (enx*) interface block in `ip addr show` output:
+# the interface name and its first 172.x IPv4 address. Continuation lines of
+# a block are indented, so the match can't leak into the next interface.
+_IP_ADDR_GOPRO_RE = re.compile(
+    r'^\d+:\s+(enx[^:@\s]+)[^\n]*\n(?:[ \t][^\n]*\n)*?[ \t]+inet (172\.\d+\.\d+\.\d+)/',
+    re.M
+)
+
+
+SYS_CLASS_NET = '/sys/class/net'
+SIOCGIFADDR = 0x8915
+
+
+def _list_gopro_interfaces():
+    """Return [(interface, our_ip)] for USB-Ethernet interfaces with a 172.x address
+
+    Reads interface names from sysfs and asks the kernel for each one's IPv4
+    address with SIOCGIFADDR, so the UI's discovery polling doesn't fork
+    `ip` every time. Falls back to parsing `ip addr show` if that fails.
+    """
+    try:
+        names = sorted(n for n in os.listdir(SYS_CLASS_NET) if n.startswith('enx'))
+        interfaces = []
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
+            for name in names:
+                try:
+                    ifreq = fcntl.ioctl(sock.fileno(), SIOCGIFADDR,
+                                        struct.pack('256s', name.encode()[:15]))
+                except OSError:
+                    continue  # Interface is up but has no IPv4 address yet
+                our_ip = socket.inet_ntoa(ifreq[20:24])
+                if our_ip.startswith('172.'):
+                    interfaces.append((name, our_ip))
+        return interfaces
+    except OSError as e:
+        logger.debug(f"Interface lookup via sysfs/ioctl failed, using ip addr: {e}")
+
+    result = subprocess.run(['ip', 'addr', 'show'],
+                          capture_output=True, text=True, timeout=5)
+    return _IP_ADDR_GOPRO_RE.findall(result.stdout)
+
+
+def _discover_connected_gopros():
     """Discover all connected GoPro cameras"""
     global gopro_ip_cache
     gopros = []
 
     try:
-        result = subprocess.run(['ip', 'addr', 'show'],
-                              capture_output=True, text=True, timeout=5)
-
-        lines = result.stdout.split('\n')
-        current_interface = None
-        current_ip = None
-
-        for line in lines:
-            if 'enx' in line and ':' in line:
-                current_interface = line.split(':')[1].strip().split('@')[0].strip()
-            elif 'inet 172.' in line and current_interface:
-                current_ip = line.strip().split()[1].split('/')[0]
+        for interface, our_ip in _list_gopro_interfaces():
+            gopro_ip = discover_gopro_ip_for_interface(interface, our_ip)
+            if gopro_ip:
+                gopro_ip_cache[interface] = gopro_ip
 
-                gopro_ip = discover_gopro_ip_for_interface(current_interface, current_ip)
-                if gopro_ip:
-                    gopro_ip_cache[current_interface] = gopro_ip
+            # Check actual camera recording state (not just internal dict)
+            actual_recording = False
+            if gopro_ip:
+                try:
+                    state_resp = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=2)
+                    if state_resp.status_code == 200:
+                        _remember_gopro_ip(interface, gopro_ip)
+                        state = state_resp.json()
+                        actual_recording = state.get('status', {}).get('8', 0) == 1
+                except:
+                    # Fall back to internal dict if camera query fails
+                    actual_recording = interface in recording_processes
+            else:
+                actual_recording = interface in recording_processes
 
-                # Check actual camera recording state (not just internal dict)
-                actual_recording = False
-                if gopro_ip:
-                    try:
-                        state_resp = requests.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=2)
-                        if state_resp.status_code == 200:
-                            state = state_resp.json()
-                            actual_recording = state.get('status', {}).get('8', 0) == 1
-                    except:
-                        # Fall back to internal dict if camera query fails
-                        actual_recording = current_interface in recording_processes
-                else:
-                    actual_recording = current_interface in recording_processes
-
-                gopro_info = {
-                    'id': current_interface,
-                    'name': f'GoPro-{current_interface[-4:]}',
-                    'interface': current_interface,
-                    'ip': current_ip,
-                    'gopro_ip': gopro_ip,
-                    'status': 'connected',
-                    'is_recording': actual_recording
-                }
-                gopros.append(gopro_info)
-                current_interface = None
-                current_ip = None
+            gopro_info = {
+                'id': interface,
+                'name': f'GoPro-{interface[-4:]}',
+                'interface': interface,
+                'ip': our_ip,
+                'gopro_ip': gopro_ip,
+                'status': 'connected',
+                'is_recording': actual_recording
+            }
+            gopros.append(gopro_info)
 
     except Exception as e:
         print(f"Error discovering GoPros: {e}")
@@ -279,14 +468,22 @@ def get_gopro_wired_ip(gopro_id):
     """Get the cached or discover GoPro IP for a specific interface"""
     if gopro_id in gopro_ip_cache:
         ip = gopro_ip_cache[gopro_id]
+        verified_at = _gopro_ip_verified_at.get(gopro_id)
+        if verified_at is not None and time.monotonic() - verified_at < GOPRO_IP_VERIFIED_TTL:
+            return ip
         try:
-            response = requests.get(f'http://{ip}:8080/gopro/camera/state', timeout=1)
+            response = _gopro_session.get(f'http://{ip}:8080/gopro/camera/state', timeout=1)
             if response.status_code == 200:
+                _remember_gopro_ip(gopro_id, ip)
                 return ip
         except:
             pass
+        _gopro_ip_verified_at.pop(gopro_id, None)
+        _gopro_discovery_cache.pop(gopro_id, None)
     
-    gopros = get_connected_gopros()
+    # The cached IP just failed its probe, so rediscover rather than
+    # trusting a cached scan that may still list it
+    gopros = get_connected_gopros(use_cache=False)
     gopro = next((g for g in gopros if g['id'] == gopro_id), None)
     
     if gopro and gopro.get('gopro_ip'):
@@ -299,13 +496,13 @@ def enable_usb_control(gopro_ip):
     Toggles USB control off then on to reset any stuck state."""
     try:
         # Disable first to reset any stuck USB control state
-        requests.get(
+        _gopro_session.get(
             f'http://{gopro_ip}:8080/gopro/camera/control/wired_usb?p=0',
             timeout=5
         )
         time.sleep(2)
         # Re-enable USB control
-        response = requests.get(
+        response = _gopro_session.get(
             f'http://{gopro_ip}:8080/gopro/camera/control/wired_usb?p=1',
             timeout=5
         )
@@ -318,19 +515,26 @@ def enable_usb_control(gopro_ip):
         print(f"⚠ Failed to enable USB control: {e}")
     return False
 
+# GoPro names its video chapters in upper case; lower case is accepted for
+# files copied onto the card by hand
+_MP4_SUFFIXES = ('.MP4', '.mp4')
+
+
 def get_gopro_files(gopro_ip):
-    """Get set of all current files on GoPro"""
+    """Get frozenset of all current video (.MP4) files on GoPro"""
     files = set()
     try:
-        response = requests.get(f'http://{gopro_ip}:8080/gopro/media/list', timeout=10)
+        response = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/media/list', timeout=10)
         if response.status_code == 200:
-            media_list = response.json()
+            media_list = _json_loads(response.content)
             for directory in media_list.get('media', []):
-                for file_info in directory.get('fs', []):
-                    files.add(file_info['n'])
+                files.update(
+                    file_info['n'] for file_info in directory.get('fs', [])
+                    if file_info['n'].endswith(_MP4_SUFFIXES)
+                )
     except Exception as e:
         print(f"Error getting GoPro files: {e}")
-    return files
+    return frozenset(files)
 
 
 def _stop_gopro_with_retry(gopro_ip, gopro_id, max_retries=3):
@@ -346,7 +550,7 @@ def _stop_gopro_with_retry(gopro_ip, gopro_id, max_retries=3):
     """
     for attempt in range(1, max_retries + 1):
         try:
-            response = requests.get(
+            response = _gopro_session.get(
                 f'http://{gopro_ip}:8080/gopro/camera/shutter/stop',
                 timeout=5
             )
@@ -360,7 +564,7 @@ def _stop_gopro_with_retry(gopro_ip, gopro_id, max_retries=3):
         # Verify GoPro actually stopped by checking camera state
         time.sleep(2)
         try:
-            state_response = requests.get(
+            state_response = _gopro_session.get(
                 f'http://{gopro_ip}:8080/gopro/camera/state',
                 timeout=5
             )
@@ -385,8 +589,19 @@ def _stop_gopro_with_retry(gopro_ip, gopro_id, max_retries=3):
     return False
 
 
+# Delay before each media list re-poll while the listing is still empty or
+# changing
+MEDIA_LIST_POLL_BACKOFF = (0.2, 0.4, 0.8, 1.6, 2.0)
+# The listing only counts as settled once it has been unchanged this long: a
+# camera still closing its last chapter can return the same listing to two
+# polls a few hundred ms apart
+MEDIA_LIST_STABLE_SECONDS = 4.0
+# Stop waiting for the listing to settle after this long
+MEDIA_LIST_MAX_WAIT = 20.0
+
+
 def _fetch_gopro_chapters(gopro_ip, pre_record_files=None, label=''):
-    """Fetch chapter files from GoPro SD card, waiting for file count to stabilize.
+    """Fetch chapter files from GoPro SD card, waiting for file count and size to stabilize.
 
     Args:
         gopro_ip: GoPro HTTP API IP address
@@ -400,54 +615,81 @@ def _fetch_gopro_chapters(gopro_ip, pre_record_files=None, label=''):
         pre_record_files = set()
 
     new_chapters = []
-    last_chapter_count = 0
-    stable_count = 0
-    max_retries = 10
-
-    for attempt in range(max_retries):
-        logger.info(f"[{label}] Getting media list (attempt {attempt + 1}/{max_retries})...")
+    total_size = 0
+    last_snapshot = None
+    etag = None
+    start = last_change = time.monotonic()
+    changing_polls = 0
+    attempt = 0
+
+    while True:
+        attempt += 1
+        settling = False
+        logger.info("[%s] Getting media list (attempt %d)...", label, attempt)
         try:
-            media_response = requests.get(
+            headers = {'If-None-Match': etag} if etag else None
+            media_response = _gopro_session.get(
                 f'http://{gopro_ip}:8080/gopro/media/list',
+                headers=headers,
                 timeout=15
             )
-            media_list = media_response.json()
 
-            new_chapters = []
-            for directory in media_list.get('media', []):
-                dir_name = directory['d']
-                for file_info in directory.get('fs', []):
-                    filename = file_info['n']
-                    if filename not in pre_record_files and filename.lower().endswith('.mp4'):
-                        new_chapters.append({
-                            'directory': dir_name,
-                            'filename': filename,
-                            'size': int(file_info.get('s', 0))
-                        })
-
-            logger.info(f"[{label}] Found {len(new_chapters)} new chapters")
-
-            if len(new_chapters) == last_chapter_count and len(new_chapters) > 0:
-                stable_count += 1
-                if stable_count >= 2:
-                    logger.info(f"[{label}] Chapter count stable at {len(new_chapters)}")
-                    break
+            # 304 means the SD card listing is unchanged since the last poll,
+            # so the previous chapter list still stands
+            if media_response.status_code != 304:
+                etag = media_response.headers.get('ETag')
+                media_list = _json_loads(media_response.content)
+
+                new_chapters = []
+                total_size = 0
+                for directory in media_list.get('media', []):
+                    dir_name = directory['d']
+                    for file_info in directory.get('fs', []):
+                        filename = file_info['n']
+                        if filename.endswith(_MP4_SUFFIXES) and filename not in pre_record_files:
+                            size = int(file_info.get('s', 0))
+                            new_chapters.append({
+                                'directory': dir_name,
+                                'filename': filename,
+                                'size': size
+                            })
+                            total_size += size
+
+                logger.info("[%s] Found %d new chapters", label, len(new_chapters))
+
+            # Files are settled once both the chapter count and total size
+            # have stopped changing for MEDIA_LIST_STABLE_SECONDS (the last
+            # chapter grows until it is closed)
+            snapshot = (len(new_chapters), total_size)
+            if snapshot != last_snapshot or not new_chapters:
+                last_snapshot = snapshot
+                last_change = time.monotonic()
+            elif time.monotonic() - last_change >= MEDIA_LIST_STABLE_SECONDS:
+                logger.info(f"[{label}] Chapter count stable at {len(new_chapters)}")
+                break
             else:
-                stable_count = 0
-                last_chapter_count = len(new_chapters)
+                settling = True
 
         except Exception as e:
             logger.warning(f"[{label}] Error getting media list: {e}")
 
-        if attempt < max_retries - 1:
-            time.sleep(2)
+        now = time.monotonic()
+        if now - start >= MEDIA_LIST_MAX_WAIT:
+            logger.warning(f"[{label}] Media list did not settle within {MEDIA_LIST_MAX_WAIT:.0f}s")
+            break
+        if settling:
+            # Unchanged so far: re-check once the stability window has passed
+            time.sleep(max(0.0, last_change + MEDIA_LIST_STABLE_SECONDS - now))
+        else:
+            time.sleep(MEDIA_LIST_POLL_BACKOFF[min(changing_polls, len(MEDIA_LIST_POLL_BACKOFF) - 1)])
+            changing_polls += 1
 
     return new_chapters
 
 def get_gopro_camera_name(gopro_ip):
     """Get the camera name from GoPro's API (ap_ssid field)"""
     try:
-        response = requests.get(f'http://{gopro_ip}:8080/gopro/camera/info', timeout=5)
+        response = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/camera/info', timeout=5)
         if response.status_code == 200:
             info = response.json()
             # ap_ssid can be at top level or nested under 'info'
@@ -460,17 +702,38 @@ def get_gopro_camera_name(gopro_ip):
     return None
 
 
+# Characters that are invalid in filenames, mapped to '_'
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+
 def sanitize_filename(name):
     """Sanitize a string for use in a filename"""
-    # Replace characters that are invalid in filenames
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        name = name.replace(char, '_')
-    return name.strip()
+    return name.translate(_SANITIZE_TABLE).strip()
 
 
 # Only these four session/angle types (no UNKNOWN in UI).
 VALID_ANGLE_CODES = ('FL', 'FR', 'NL', 'NR')
+_VALID_ANGLE_CODE_SET = frozenset(VALID_ANGLE_CODES)
+
+# Parsed CAMERA_ANGLE_MAP, keyed by the raw env string it was parsed from so
+# it is only re-parsed if the variable changes.
+_camera_angle_map_cache = (None, {})
+
+
+def _get_camera_angle_map():
+    """Return the parsed CAMERA_ANGLE_MAP env var ({} if unset or invalid)"""
+    global _camera_angle_map_cache
+    raw = os.getenv('CAMERA_ANGLE_MAP', '{}')
+    cached_raw, angle_map = _camera_angle_map_cache
+    if raw != cached_raw:
+        try:
+            angle_map = json.loads(raw)
+            if not isinstance(angle_map, dict):
+                angle_map = {}
+        except json.JSONDecodeError:
+            angle_map = {}
+        _camera_angle_map_cache = (raw, angle_map)
+    return angle_map
 
 
 def _get_angle_code_from_camera_name(camera_name: str) -> str:
@@ -485,14 +748,10 @@ def _get_angle_code_from_camera_name(camera_name: str) -> str:
         Angle code: one of FL, FR, NL, NR
     """
     # Try CAMERA_ANGLE_MAP env var first
-    angle_map_str = os.getenv('CAMERA_ANGLE_MAP', '{}')
-    try:
-        angle_map = json.loads(angle_map_str)
-        if camera_name in angle_map:
-            result = angle_map[camera_name]
-            return result if result in VALID_ANGLE_CODES else 'NL'
-    except json.JSONDecodeError:
-        pass
+    angle_map = _get_camera_angle_map()
+    if camera_name in angle_map:
+        result = angle_map[camera_name]
+        return result if result in _VALID_ANGLE_CODE_SET else 'NL'
 
     # Fallback: extract from camera name like "GoPro FL"
     if camera_name:
@@ -502,106 +761,86 @@ def _get_angle_code_from_camera_name(camera_name: str) -> str:
 
     return 'NL'  # Default so we never return UNK/UNKNOWN
 
+# Cached result of _scan_video_list(). Invalidated when the storage directory
+# changes (file added/removed/renamed) or after a short TTL so the size of a
+# file that is still being written does not go stale for long.
+VIDEO_LIST_CACHE_TTL = 5  # seconds
+_video_list_cache = {'key': None, 'ts': 0.0, 'videos': [], 'total_size_mb': 0.0}
+_video_list_cache_lock = threading.Lock()
+
+
+def invalidate_video_list_cache():
+    """Drop the cached video list (call after deleting/writing videos)"""
+    with _video_list_cache_lock:
+        _video_list_cache['key'] = None
+
+
+def _cached_video_list():
+    """(videos, total_size_mb) from the cache, rescanning if it is stale"""
+    try:
+        key = os.stat(VIDEO_STORAGE_DIR).st_mtime_ns
+    except OSError:
+        key = None
+    now = time.monotonic()
+    with _video_list_cache_lock:
+        if (key is not None and _video_list_cache['key'] == key
+                and now - _video_list_cache['ts'] < VIDEO_LIST_CACHE_TTL):
+            return _video_list_cache['videos'], _video_list_cache['total_size_mb']
+
+    videos = _scan_video_list()
+    # Summed once per scan so system_info doesn't walk the list per poll
+    total_size_mb = sum(v['size_mb'] for v in videos)
+    with _video_list_cache_lock:
+        _video_list_cache['key'] = key
+        _video_list_cache['ts'] = now
+        _video_list_cache['videos'] = videos
+        _video_list_cache['total_size_mb'] = total_size_mb
+    return videos, total_size_mb
+
+
 def get_video_list():
-    """Get list of all recorded videos"""
+    """Get list of all recorded videos (cached, see VIDEO_LIST_CACHE_TTL)"""
+    videos, _ = _cached_video_list()
+    return list(videos)
+
+
+def get_video_stats():
+    """(video_count, total_size_mb) for the recorded videos, without copying the list"""
+    videos, total_size_mb = _cached_video_list()
+    return len(videos), total_size_mb
+
+
+def _scan_video_list():
+    """Scan VIDEO_STORAGE_DIR for recorded videos"""
     videos = []
     try:
-        video_path = Path(VIDEO_STORAGE_DIR)
-        for video_file in video_path.glob('*.mp4'):
-            stat = video_file.stat()
-            videos.append({
-                'filename': video_file.name,
-                'path': str(video_file),
+        # scandir reuses the dirent type from getdents, so only one stat()
+        # per video is needed (Path.glob + stat costs two). Symlinks are
+        # skipped: their targets may lie outside the storage directory and
+        # would be refused by _safe_video_path anyway.
+        with os.scandir(VIDEO_STORAGE_DIR) as entries:
+            stats = [
+                (entry, entry.stat(follow_symlinks=False))
+                for entry in entries
+                if entry.name.endswith('.mp4') and entry.is_file(follow_symlinks=False)
+            ]
+        # Sort on the raw ctime rather than the formatted ISO strings
+        stats.sort(key=lambda item: item[1].st_ctime, reverse=True)
+        videos = [
+            {
+                'filename': entry.name,
+                'path': entry.path,
                 'size_mb': round(stat.st_size / (1024 * 1024), 2),
                 'created': datetime.fromtimestamp(stat.st_ctime).isoformat(),
                 'modified': datetime.fromtimestamp(stat.st_mtime).isoformat()
-            })
-        videos.sort(key=lambda x: x['created'], reverse=True)
+            }
+            for entry, stat in stats
+        ]
     except Exception as e:
         print(f"Error listing videos: {e}")
 
     return videos
 
-def download_gopro_video(gopro_ip, output_path, progress_callback=None):
-    """Download the latest video from GoPro"""
-    try:
-        print(f"Fetching media list from {gopro_ip}...")
-        media_response = requests.get(
-            f'http://{gopro_ip}:8080/gopro/media/list',
-            timeout=10
-        )
-        media_list = media_response.json()
-
-        last_dir = media_list['media'][-1]
-        last_file = last_dir['fs'][-1]
-        gopro_filename = last_file['n']
-
-        download_url = f'http://{gopro_ip}:8080/videos/DCIM/{last_dir["d"]}/{gopro_filename}'
-        print(f"Downloading from: {download_url}")
-
-        download_response = requests.get(download_url, stream=True, timeout=300)
-        total_size = int(download_response.headers.get('content-length', 0))
-        downloaded = 0
-
-        with open(output_path, 'wb') as f:
-            for chunk in download_response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
-                    if progress_callback and total_size > 0:
-                        progress = int((downloaded / total_size) * 100)
-                        progress_callback(progress)
-
-        print(f"✓ Download complete: {output_path}")
-        return True
-    except Exception as e:
-        print(f"Download error: {e}")
-        return False
-
-def merge_videos_ffmpeg(video_files, output_path):
-    """Merge multiple video files using ffmpeg"""
-    if not video_files:
-        return False
-    
-    if len(video_files) == 1:
-        # Just copy the single file
-        import shutil
-        shutil.copy2(video_files[0], output_path)
-        print(f"✓ Single file copied to: {output_path}")
-        return True
-    
-    video_files = sorted(video_files, key=lambda x: os.path.basename(x))
-    
-    concat_file = os.path.join(os.path.dirname(output_path), 'concat_list.txt')
-    with open(concat_file, 'w') as f:
-        for video in video_files:
-            f.write(f"file '{os.path.abspath(video)}'\n")
-    
-    try:
-        cmd = [
-            'ffmpeg',
-            '-f', 'concat',
-            '-safe', '0',
-            '-i', concat_file,
-            '-c', 'copy',
-            '-y',
-            output_path
-        ]
-        
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=600)
-        
-        os.remove(concat_file)
-        
-        if result.returncode == 0:
-            print(f"✓ Successfully merged {len(video_files)} videos to: {output_path}")
-            return True
-        else:
-            print(f"FFmpeg error: {result.stderr}")
-            return False
-    except Exception as e:
-        print(f"Error merging videos: {e}")
-        return False
-
 @app.route('/health', methods=['GET'])
 def health():
     """Health check endpoint"""
@@ -639,6 +878,28 @@ def gopro_status(gopro_id):
         'gopro': gopro
     })
 
+def _verify_recording_started(gopro_id, gopro_ip):
+    """Wait a moment and verify recording actually started on the camera"""
+    time.sleep(1)
+    is_recording = None
+    try:
+        state_response = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=5)
+        if state_response.status_code == 200:
+            state = state_response.json()
+            # Status 8 = busy/encoding, Status 10 = recording
+            is_recording = state.get('status', {}).get('8', 0) == 1 or state.get('status', {}).get('10', 0) == 1
+            if not is_recording:
+                print(f"⚠ Recording may not have started - camera not in recording state")
+                # Don't fail - the shutter command succeeded, camera might just be slow
+            else:
+                print(f"✓ Confirmed recording active on {gopro_id}")
+    except Exception as e:
+        print(f"⚠ Could not verify recording state: {e}")
+
+    with recording_lock:
+        if gopro_id in recording_processes:
+            recording_processes[gopro_id]['recording_confirmed'] = is_recording
+
 @app.route('/api/gopros/<gopro_id>/record/start', methods=['POST'])
 def start_recording(gopro_id):
     """Start recording using direct HTTP API (no gopro-video dependency)"""
@@ -656,7 +917,7 @@ def start_recording(gopro_id):
     # Check ACTUAL camera state before rejecting
     actual_recording = False
     try:
-        state_resp = requests.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=3)
+        state_resp = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=3)
         if state_resp.status_code == 200:
             state = state_resp.json()
             actual_recording = state.get('status', {}).get('8', 0) == 1
@@ -698,7 +959,7 @@ def start_recording(gopro_id):
         # Set camera to Video mode
         print(f"Setting {gopro_id} ({gopro_ip}) to Video mode...")
         try:
-            response = requests.get(
+            response = _gopro_session.get(
                 f'http://{gopro_ip}:8080/gopro/camera/presets/load?id=0',
                 timeout=5
             )
@@ -724,7 +985,7 @@ def start_recording(gopro_id):
         print(f"Waiting for {gopro_id} ({gopro_ip}) to be ready...")
         for wait_attempt in range(10):
             try:
-                state_resp = requests.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=5)
+                state_resp = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=5)
                 if state_resp.status_code == 200:
                     cam_state = state_resp.json()
                     system_busy = cam_state.get('status', {}).get('31', 0)
@@ -743,7 +1004,7 @@ def start_recording(gopro_id):
         max_retries = 3
         response = None
         for attempt in range(1, max_retries + 1):
-            response = requests.get(
+            response = _gopro_session.get(
                 f'http://{gopro_ip}:8080/gopro/camera/shutter/start',
                 timeout=5
             )
@@ -753,7 +1014,7 @@ def start_recording(gopro_id):
             logger.warning(f"Shutter start attempt {attempt}/{max_retries} on {gopro_id} failed: HTTP {response.status_code}, body={response.text!r}")
             # Check camera state for debugging
             try:
-                dbg_state = requests.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=5).json()
+                dbg_state = _gopro_session.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=5).json()
                 dbg_status = dbg_state.get('status', {})
                 logger.warning(f"Camera state after failed shutter: busy={dbg_status.get('31')}, encoding={dbg_status.get('8')}, "
                              f"ready={dbg_status.get('82')}, mode={dbg_status.get('43')}, sd_status={dbg_status.get('33')}")
@@ -781,22 +1042,6 @@ def start_recording(gopro_id):
         except:
             pass  # Response might not be JSON
 
-        # Wait a moment and verify recording actually started
-        time.sleep(1)
-        try:
-            state_response = requests.get(f'http://{gopro_ip}:8080/gopro/camera/state', timeout=5)
-            if state_response.status_code == 200:
-                state = state_response.json()
-                # Status 8 = busy/encoding, Status 10 = recording
-                is_recording = state.get('status', {}).get('8', 0) == 1 or state.get('status', {}).get('10', 0) == 1
-                if not is_recording:
-                    print(f"⚠ Recording may not have started - camera not in recording state")
-                    # Don't fail - the shutter command succeeded, camera might just be slow
-                else:
-                    print(f"✓ Confirmed recording active on {gopro_id}")
-        except Exception as e:
-            print(f"⚠ Could not verify recording state: {e}")
-
         print(f"✓ Recording started on {gopro_id}")
 
         # Get camera name (ap_ssid) from GoPro for the filename
@@ -852,6 +1097,18 @@ def start_recording(gopro_id):
                 'stage_message': 'Recording...'
             }
 
+        _remember_gopro_ip(gopro_id, gopro_ip)
+        invalidate_gopros_cache()
+
+        # Confirm the camera actually entered recording state off the request
+        # thread; the shutter command already succeeded so this never fails
+        # the start, it only reports via recording_confirmed.
+        threading.Thread(
+            target=_verify_recording_started,
+            args=(gopro_id, gopro_ip),
+            daemon=True
+        ).start()
+
         return jsonify({
             'success': True,
             'message': 'Recording started',
@@ -874,13 +1131,25 @@ def start_recording(gopro_id):
             'error': 'Could not connect to GoPro'
         }), 500
     except Exception as e:
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[{gopro_id}] Error in start_recording: {e}")
         with recording_lock:
             if gopro_id in recording_processes:
                 del recording_processes[gopro_id]
         return jsonify({'success': False, 'error': str(e)}), 500
 
+# How long a finalized recording stays visible (stage='ready') to status polls
+RECORDING_READY_VISIBLE_SECONDS = 3
+
+
+def _evict_finalized_recording(gopro_id, info):
+    """Remove a finalized recording entry, unless a new recording replaced it"""
+    with recording_lock:
+        if recording_processes.get(gopro_id) is info:
+            del recording_processes[gopro_id]
+            recording_lock.notify_all()
+            logger.info(f"[{gopro_id}] Recording finalized, ready for pipeline")
+
+
 @app.route('/api/gopros/<gopro_id>/record/stop', methods=['POST'])
 def stop_recording(gopro_id):
     """
@@ -900,14 +1169,15 @@ def stop_recording(gopro_id):
         if gopro_id not in recording_processes:
             return jsonify({'success': False, 'error': 'Not currently recording'}), 400
 
-        recording_processes[gopro_id]['is_stopping'] = True
-        recording_info = recording_processes[gopro_id].copy()
-
-    try:
+        # Read just the fields the stop path needs instead of copying the
+        # whole record; they are never mutated in place once recording starts
+        recording_info = recording_processes[gopro_id]
+        recording_info['is_stopping'] = True
         gopro_ip = recording_info.get('gopro_ip')
         pre_record_files = recording_info.get('pre_record_files', set())
         firebase_session_id = recording_info.get('firebase_session_id')
 
+    try:
         if not gopro_ip:
             gopro_ip = get_gopro_wired_ip(gopro_id)
 
@@ -915,6 +1185,7 @@ def stop_recording(gopro_id):
             with recording_lock:
                 if gopro_id in recording_processes:
                     del recording_processes[gopro_id]
+                    recording_lock.notify_all()
             return jsonify({'success': False, 'error': 'Could not detect GoPro IP'}), 500
 
         # Send stop command to camera with retries and state verification
@@ -922,6 +1193,7 @@ def stop_recording(gopro_id):
         stop_confirmed = _stop_gopro_with_retry(gopro_ip, gopro_id)
         if not stop_confirmed:
             logger.warning(f"[{gopro_id}] Stop not confirmed, proceeding with finalization anyway")
+        invalidate_gopros_cache()
 
         with recording_lock:
             if gopro_id in recording_processes:
@@ -972,29 +1244,31 @@ def stop_recording(gopro_id):
 
                 # Mark as done (ready for pipeline)
                 with recording_lock:
-                    if gopro_id in recording_processes:
-                        recording_processes[gopro_id]['stage'] = 'ready'
-                        recording_processes[gopro_id]['stage_message'] = f'Ready! {len(new_chapters)} chapters to upload'
-                        recording_processes[gopro_id]['total_chapters'] = len(new_chapters)
-                        recording_processes[gopro_id]['total_size_bytes'] = total_size_bytes
-
-                # Keep in recording_processes briefly so UI can see the status
-                time.sleep(3)
-
-                with recording_lock:
-                    if gopro_id in recording_processes:
-                        del recording_processes[gopro_id]
-                        logger.info(f"[{gopro_id}] Recording finalized, ready for pipeline")
+                    info = recording_processes.get(gopro_id)
+                    if info is not None:
+                        info['stage'] = 'ready'
+                        info['stage_message'] = f'Ready! {len(new_chapters)} chapters to upload'
+                        info['total_chapters'] = len(new_chapters)
+                        info['total_size_bytes'] = total_size_bytes
+                        recording_lock.notify_all()
+
+                if info is not None:
+                    # Keep in recording_processes briefly so UI can see the
+                    # status; a timer evicts it without holding this thread
+                    threading.Timer(
+                        RECORDING_READY_VISIBLE_SECONDS,
+                        _evict_finalized_recording,
+                        args=(gopro_id, info)
+                    ).start()
 
             except Exception as e:
-                logger.error(f"[{gopro_id}] Error in finalize_and_register: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"[{gopro_id}] Error in finalize_and_register: {e}")
                 with recording_lock:
                     if gopro_id in recording_processes:
                         recording_processes[gopro_id]['stage'] = 'error'
                         recording_processes[gopro_id]['stage_message'] = f'Error: {str(e)}'
                         del recording_processes[gopro_id]
+                        recording_lock.notify_all()
 
         threading.Thread(target=finalize_and_register, daemon=True).start()
 
@@ -1005,9 +1279,7 @@ def stop_recording(gopro_id):
         })
 
     except Exception as e:
-        logger.error(f"[{gopro_id}] Error in stop_recording: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[{gopro_id}] Error in stop_recording: {e}")
         with recording_lock:
             if gopro_id in recording_processes:
                 del recording_processes[gopro_id]
@@ -1016,28 +1288,34 @@ def stop_recording(gopro_id):
 @app.route('/api/gopros/<gopro_id>/record/status', methods=['GET'])
 def recording_status(gopro_id):
     """Get current recording status including any errors"""
+    # Snapshot under the lock (writers update several keys at a time), then
+    # serialize outside it
     with recording_lock:
-        if gopro_id not in recording_processes:
-            return jsonify({
-                'success': True,
-                'is_recording': False
-            })
+        info = recording_processes.get(gopro_id)
+        if info is not None:
+            info = dict(info)
 
-        info = recording_processes[gopro_id]
+    if info is None:
         return jsonify({
             'success': True,
-            'is_recording': True,
-            'recording_started': info.get('recording_started', False),
-            'start_time': info.get('start_time'),
-            'video_filename': info.get('video_filename'),
-            'is_stopping': info.get('is_stopping', False),
-            'downloading': info.get('downloading', False),
-            'download_progress': info.get('download_progress', 0),
-            'stage': info.get('stage', 'recording'),
-            'stage_message': info.get('stage_message', 'Recording...'),
-            'error': info.get('error')
+            'is_recording': False
         })
 
+    return jsonify({
+        'success': True,
+        'is_recording': True,
+        'recording_started': info.get('recording_started', False),
+        'recording_confirmed': info.get('recording_confirmed'),
+        'start_time': info.get('start_time'),
+        'video_filename': info.get('video_filename'),
+        'is_stopping': info.get('is_stopping', False),
+        'downloading': info.get('downloading', False),
+        'download_progress': info.get('download_progress', 0),
+        'stage': info.get('stage', 'recording'),
+        'stage_message': info.get('stage_message', 'Recording...'),
+        'error': info.get('error')
+    })
+
 
 @app.route('/api/recording/stop-all-and-process', methods=['POST'])
 def stop_all_and_process():
@@ -1072,9 +1350,11 @@ def stop_all_and_process():
     data = request.get_json() or {}
     auto_delete_sd = data.get('auto_delete_sd', True)
 
-    # Find all recording GoPros from internal state
+    # Find all recording GoPros and their known IPs in one pass under the
+    # lock; IP discovery and camera I/O below all happen outside it
     with recording_lock:
-        recording_gopros = list(recording_processes.keys())
+        known_ips = {gid: info.get('gopro_ip') for gid, info in recording_processes.items()}
+    recording_gopros = list(known_ips)
 
     # If no recordings in internal state, check actual GoPro state
     # This handles cases where recordings were started externally or after server restart
@@ -1082,36 +1362,42 @@ def stop_all_and_process():
         logger.info("[Stop All] No recordings in internal state, checking actual GoPro state...")
 
         # Discover all connected GoPros
-        discovered_gopros = get_connected_gopros()
+        discovered_gopros = [
+            g for g in get_connected_gopros(use_cache=False) if g.get('gopro_ip')
+        ]
 
-        for gopro in discovered_gopros:
+        def _is_recording(gopro):
+            # Status 8 = is_recording (1 = true, 0 = false)
+            state_response = _gopro_session.get(
+                f"http://{gopro['gopro_ip']}:8080/gopro/camera/state",
+                timeout=3
+            )
+            if state_response.status_code != 200:
+                return False
+            return state_response.json().get('status', {}).get('8', 0) == 1
+
+        # Check every camera's actual recording state concurrently
+        futures = {_gopro_probe_pool.submit(_is_recording, g): g for g in discovered_gopros}
+        for future in as_completed(futures):
+            gopro = futures[future]
             gopro_id = gopro.get('interface')
-            gopro_ip = gopro.get('gopro_ip')
+            try:
+                if future.result():
+                    logger.info(f"[Stop All] Found recording GoPro: {gopro_id} (from camera state)")
+                    known_ips[gopro_id] = gopro['gopro_ip']
+            except Exception as e:
+                logger.warning(f"[Stop All] Could not check state for {gopro_id}: {e}")
 
-            if gopro_ip:
-                try:
-                    # Check actual recording state from GoPro
-                    state_response = requests.get(
-                        f'http://{gopro_ip}:8080/gopro/camera/state',
-                        timeout=3
-                    )
-                    if state_response.status_code == 200:
-                        state = state_response.json()
-                        # Status 8 = is_recording (1 = true, 0 = false)
-                        is_recording = state.get('status', {}).get('8', 0) == 1
-
-                        if is_recording:
-                            logger.info(f"[Stop All] Found recording GoPro: {gopro_id} (from camera state)")
-                            recording_gopros.append(gopro_id)
-                            # Add to internal state for tracking
-                            with recording_lock:
-                                recording_processes[gopro_id] = {
-                                    'gopro_ip': gopro_ip,
-                                    'is_recording': True,
-                                    'discovered_externally': True
-                                }
-                except Exception as e:
-                    logger.warning(f"[Stop All] Could not check state for {gopro_id}: {e}")
+        if known_ips:
+            recording_gopros = list(known_ips)
+            # Add to internal state for tracking
+            with recording_lock:
+                for gopro_id, gopro_ip in known_ips.items():
+                    recording_processes.setdefault(gopro_id, {
+                        'gopro_ip': gopro_ip,
+                        'is_recording': True,
+                        'discovered_externally': True
+                    })
 
     if not recording_gopros:
         # Still no recordings - check for pending sessions and start pipeline
@@ -1134,37 +1420,55 @@ def stop_all_and_process():
     stopped_gopros = []
     stop_errors = []
 
-    for gopro_id in recording_gopros:
-        try:
-            # Get GoPro IP
-            with recording_lock:
-                if gopro_id in recording_processes:
-                    gopro_ip = recording_processes[gopro_id].get('gopro_ip')
-                    if not gopro_ip:
-                        gopro_ip = get_gopro_wired_ip(gopro_id)
-
-            if gopro_ip:
-                # Send stop command with retries
-                stop_confirmed = _stop_gopro_with_retry(gopro_ip, gopro_id)
-                if stop_confirmed:
-                    stopped_gopros.append(gopro_id)
-                    logger.info(f"[Stop All] Stopped recording on {gopro_id}")
-                else:
-                    stop_errors.append(f"{gopro_id}: stop not confirmed after retries")
-                    logger.warning(f"[Stop All] Failed to confirm stop on {gopro_id}")
-                    # Still add to stopped list — GoPro may have stopped but state check failed
-                    stopped_gopros.append(gopro_id)
-
-                # Mark as stopping
-                with recording_lock:
-                    if gopro_id in recording_processes:
-                        recording_processes[gopro_id]['is_stopping'] = True
-                        recording_processes[gopro_id]['stage'] = 'stopping'
-                        recording_processes[gopro_id]['stage_message'] = 'Stopping GoPro...'
+    def _send_stop(gopro_id):
+        """Stop one GoPro; returns stop_confirmed, or None if it has no IP"""
+        gopro_ip = known_ips[gopro_id] or get_gopro_wired_ip(gopro_id)
+        if not gopro_ip:
+            return None
+        # Send stop command with retries
+        return _stop_gopro_with_retry(gopro_ip, gopro_id)
+
+    # Stop all cameras concurrently: each stop is a few HTTP round trips
+    # (plus retries), so the endpoint takes as long as the slowest camera
+    # rather than the sum of all of them.
+    with ThreadPoolExecutor(max_workers=max(len(known_ips), 1), thread_name_prefix='gopro-stop') as executor:
+        futures = {executor.submit(_send_stop, gid): gid for gid in known_ips}
+        for future in as_completed(futures):
+            gopro_id = futures[future]
+            try:
+                stop_confirmed = future.result()
+            except Exception as e:
+                stop_errors.append(f"{gopro_id}: {e}")
+                logger.error(f"[Stop All] Error stopping {gopro_id}: {e}")
+                continue
 
-        except Exception as e:
-            stop_errors.append(f"{gopro_id}: {e}")
-            logger.error(f"[Stop All] Error stopping {gopro_id}: {e}")
+            if stop_confirmed is None:
+                continue
+            if stop_confirmed:
+                stopped_gopros.append(gopro_id)
+                logger.info(f"[Stop All] Stopped recording on {gopro_id}")
+            else:
+                stop_errors.append(f"{gopro_id}: stop not confirmed after retries")
+                logger.warning(f"[Stop All] Failed to confirm stop on {gopro_id}")
+                # Still add to stopped list — GoPro may have stopped but state check failed
+                stopped_gopros.append(gopro_id)
+    invalidate_gopros_cache()
+
+    # Mark as stopping and capture GoPro info before the monitor thread
+    # starts (recording_processes may be cleared), in one critical section
+    gopro_info_snapshot = {}
+    with recording_lock:
+        for gopro_id in stopped_gopros:
+            info = recording_processes.get(gopro_id)
+            if info is None:
+                continue
+            info['is_stopping'] = True
+            info['stage'] = 'stopping'
+            info['stage_message'] = 'Stopping GoPro...'
+            gopro_info_snapshot[gopro_id] = {
+                'gopro_ip': info.get('gopro_ip'),
+                'pre_record_files': info.get('pre_record_files', set()),
+            }
 
     if not stopped_gopros:
         return jsonify({
@@ -1173,16 +1477,6 @@ def stop_all_and_process():
             'errors': stop_errors
         }), 500
 
-    # Capture GoPro info before thread starts (recording_processes may be cleared)
-    gopro_info_snapshot = {}
-    with recording_lock:
-        for gopro_id in stopped_gopros:
-            if gopro_id in recording_processes:
-                gopro_info_snapshot[gopro_id] = {
-                    'gopro_ip': recording_processes[gopro_id].get('gopro_ip'),
-                    'pre_record_files': recording_processes[gopro_id].get('pre_record_files', set()),
-                }
-
     # Start background thread to monitor finalization and trigger pipeline
     def monitor_and_start_pipeline():
         try:
@@ -1190,29 +1484,38 @@ def stop_all_and_process():
             logger.info(f"[Stop All] Waiting for {len(stopped_gopros)} GoPros to finalize files...")
 
             max_wait = 120  # 2 minutes max (finalization is fast, ~10-15 seconds per GoPro)
-            check_interval = 2  # Check every 2 seconds
-            elapsed = 0
+            log_interval = 10  # Log progress every 10 seconds
+            deadline = time.monotonic() + max_wait
 
-            while elapsed < max_wait:
-                # Check if all stopped GoPros have finalized
-                with recording_lock:
-                    still_finalizing = [
-                        gid for gid in stopped_gopros
-                        if gid in recording_processes
-                    ]
-
-                if not still_finalizing:
-                    logger.info("[Stop All] All GoPros finalized, starting pipeline...")
-                    break
+            stopped_set = frozenset(stopped_gopros)
 
-                time.sleep(check_interval)
-                elapsed += check_interval
+            def unfinalized():
+                # Entries still present but 'ready' are done and only linger
+                # for the UI
+                return [
+                    gid for gid in stopped_set & recording_processes.keys()
+                    if recording_processes[gid].get('stage') != 'ready'
+                ]
 
-                # Log progress every 10 seconds
-                if elapsed % 10 == 0:
-                    logger.info(f"[Stop All] Still waiting for {len(still_finalizing)} GoPros to finalize: {still_finalizing}")
+            def all_finalized():
+                return not unfinalized()
 
-            if elapsed >= max_wait:
+            # Woken by notify_all() whenever a finalized GoPro is removed
+            with recording_lock:
+                done = all_finalized()
+                while not done:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    done = recording_lock.wait_for(all_finalized, timeout=min(log_interval, remaining))
+                    if not done and logger.isEnabledFor(logging.INFO):
+                        still_finalizing = unfinalized()
+                        logger.info("[Stop All] Still waiting for %d GoPros to finalize: %s",
+                                    len(still_finalizing), still_finalizing)
+
+            if done:
+                logger.info("[Stop All] All GoPros finalized, starting pipeline...")
+            else:
                 logger.warning("[Stop All] Timeout waiting for finalization, starting pipeline anyway")
 
             # IMPORTANT: Fetch real chapter data and update Firebase sessions to "stopped"
@@ -1259,9 +1562,7 @@ def stop_all_and_process():
             _start_auto_pipeline_internal(auto_delete_sd, from_background=True)
 
         except Exception as e:
-            logger.error(f"[Stop All] Error in monitor_and_start_pipeline: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception(f"[Stop All] Error in monitor_and_start_pipeline: {e}")
 
     threading.Thread(target=monitor_and_start_pipeline, daemon=True).start()
 
@@ -1276,7 +1577,6 @@ def stop_all_and_process():
 
 def _start_auto_pipeline_internal(auto_delete_sd: bool = True, from_background: bool = False):
     """Internal helper to start the automated pipeline."""
-    from pipeline_orchestrator import get_orchestrator
 
     orchestrator = get_orchestrator()
     if not orchestrator:
@@ -1298,8 +1598,8 @@ def _start_auto_pipeline_internal(auto_delete_sd: bool = True, from_background:
         }), 503
 
     try:
-        # Get recent sessions for this Jetson
-        all_sessions = firebase_service.get_recording_sessions(
+        # Get recent stopped sessions for this Jetson
+        all_sessions = firebase_service.get_stopped_sessions(
             jetson_id=firebase_service.jetson_id,
             limit=50
         )
@@ -1333,7 +1633,7 @@ def _start_auto_pipeline_internal(auto_delete_sd: bool = True, from_background:
 
         logger.info(
             f"[Pipeline] Found {len(sessions)} unprocessed sessions "
-            f"(out of {len(all_sessions)} total, {len(stale_sessions)} stale skipped, "
+            f"(out of {len(all_sessions)} stopped, {len(stale_sessions)} stale skipped, "
             f"{len(empty_sessions)} empty skipped)"
         )
 
@@ -1348,10 +1648,13 @@ def _start_auto_pipeline_internal(auto_delete_sd: bool = True, from_background:
 
         # Discover GoPro connections for sessions that need upload (no s3Prefix)
         gopro_connections = {}
-        sessions_needing_upload = [s for s in sessions if not s.get('s3Prefix')]
-        sessions_already_uploaded = [s for s in sessions if s.get('s3Prefix')]
-
-        for session in sessions_needing_upload:
+        sessions_needing_upload = []
+        sessions_already_uploaded = []
+        for session in sessions:
+            if session.get('s3Prefix'):
+                sessions_already_uploaded.append(session)
+                continue
+            sessions_needing_upload.append(session)
             interface_id = session.get('interfaceId')
             if interface_id and interface_id not in gopro_connections:
                 gopro_ip = get_gopro_wired_ip(interface_id)
@@ -1390,9 +1693,7 @@ def _start_auto_pipeline_internal(auto_delete_sd: bool = True, from_background:
         })
 
     except Exception as e:
-        logger.error(f"[Pipeline] Error starting pipeline: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[Pipeline] Error starting pipeline: {e}")
         if from_background:
             return None
         return jsonify({
@@ -1433,8 +1734,11 @@ def process_only():
 
     # Check if any GoPros are currently recording
     with recording_lock:
-        recording_gopros = [gid for gid, info in recording_processes.items()
-                          if not info.get('is_stopping', False)]
+        recording_gopros = []
+        # Cheap existence test first; only build the list for the error reply
+        if any(not info.get('is_stopping', False) for info in recording_processes.values()):
+            recording_gopros = [gid for gid, info in recording_processes.items()
+                              if not info.get('is_stopping', False)]
 
     if recording_gopros:
         return jsonify({
@@ -1452,6 +1756,17 @@ def process_only():
     return result
 
 
+# Fields reported per GoPro by /api/recording/pipeline-status, with the
+# default used when a record hasn't reached that stage yet
+_RECORDING_STATUS_FIELDS = (
+    ('is_stopping', False),
+    ('downloading', False),
+    ('download_progress', 0),
+    ('stage', 'recording'),
+    ('stage_message', 'Recording...'),
+)
+
+
 @app.route('/api/recording/pipeline-status', methods=['GET'])
 def get_recording_pipeline_status():
     """
@@ -1469,7 +1784,6 @@ def get_recording_pipeline_status():
     Pipeline sessions include: display_label (e.g. "02/02/2026 NR"), session_date
     (MM/DD/YYYY), angle_code (FL|FR|NL|NR) for the Sessions list.
     """
-    from pipeline_orchestrator import get_orchestrator
 
     result = {
         'success': True,
@@ -1477,17 +1791,14 @@ def get_recording_pipeline_status():
         'pipeline': None
     }
 
-    # Get recording status for all GoPros
+    # Get recording status for all GoPros: copy just the public fields under
+    # the lock rather than the whole record (pre-record file sets etc.)
     with recording_lock:
-        for gopro_id, info in recording_processes.items():
-            result['recording'][gopro_id] = {
-                'is_recording': True,
-                'is_stopping': info.get('is_stopping', False),
-                'downloading': info.get('downloading', False),
-                'download_progress': info.get('download_progress', 0),
-                'stage': info.get('stage', 'recording'),
-                'stage_message': info.get('stage_message', 'Recording...')
-            }
+        result['recording'] = {
+            gopro_id: {'is_recording': True,
+                       **{key: info.get(key, default) for key, default in _RECORDING_STATUS_FIELDS}}
+            for gopro_id, info in recording_processes.items()
+        }
 
     # Get pipeline status if orchestrator exists
     orchestrator = get_orchestrator()
@@ -1499,7 +1810,12 @@ def get_recording_pipeline_status():
             # The 5-minute retention in pipeline_orchestrator handles cleanup
             result['pipeline'] = latest_pipeline
 
-    return jsonify(result)
+    # The UI polls this every second or two and the state rarely changes
+    # between polls: tag the body so unchanged polls get an empty 304.
+    response = jsonify(result)
+    response.add_etag()
+    response.headers['Cache-Control'] = 'no-cache'
+    return response.make_conditional(request)
 
 
 # ==================== Recording Session Registration ====================
@@ -1522,7 +1838,7 @@ def register_recording_session():
 
     Returns:
         For start: { success: true, firebase_session_id: "..." }
-        For stop: { success: true, message: "Session updated" }
+        For stop (202): { success: true, queued: true, message: "Session update queued" }
     """
     if not firebase_service:
         return jsonify({
@@ -1630,6 +1946,46 @@ def list_recording_sessions():
         }), 500
 
 
+@app.route('/api/recording/sessions/stream', methods=['GET'])
+def stream_recording_sessions():
+    """
+    Stream recording sessions from Firebase via Server-Sent Events (SSE).
+
+    Same query params as /api/recording/sessions, but each session is sent
+    as its own `data:` event as soon as Firestore returns it, followed by
+    a final `event: done` with the count.
+    """
+    if not firebase_service:
+        return jsonify({
+            'success': False,
+            'error': 'Firebase service not configured'
+        }), 503
+
+    jetson_id = request.args.get('jetson_id')
+    limit = request.args.get('limit', 50, type=int)
+
+    def generate():
+        count = 0
+        try:
+            for session in firebase_service.iter_recording_sessions(jetson_id=jetson_id, limit=limit):
+                yield f"data: {app.json.dumps(session, default=str)}\n\n"
+                count += 1
+            yield f"event: done\ndata: {app.json.dumps({'count': count})}\n\n"
+        except Exception as e:
+            logger.error(f"[Firebase] Error streaming recording sessions: {e}")
+            yield f"event: error\ndata: {app.json.dumps({'error': str(e)})}\n\n"
+
+    return Response(
+        generate(),
+        mimetype='text/event-stream',
+        headers={
+            'Cache-Control': 'no-cache',
+            'Connection': 'keep-alive',
+            'X-Accel-Buffering': 'no'
+        }
+    )
+
+
 @app.route('/api/recording/sessions/<session_id>', methods=['GET'])
 def get_recording_session(session_id):
     """
@@ -1752,6 +2108,14 @@ def get_game(game_id):
 from plays_sync import create_plays_from_firebase_logs
 
 
+# Legacy Firebase game 'score' dicts: Uball team -> score keys, in order of
+# preference
+_LEGACY_SCORE_KEYS = (
+    ('team1', ('home', 'team1')),
+    ('team2', ('away', 'team2')),
+)
+
+
 @app.route('/api/games/sync', methods=['POST'])
 def sync_game_to_uball():
     """
@@ -1813,7 +2177,16 @@ def sync_game_to_uball():
                 'error': f'Game not found in Firebase: {firebase_game_id}'
             }), 404
 
-        logger.info(f"[GameSync] Step 1: Game found. Teams: {firebase_game.get('leftTeam', {}).get('name')} vs {firebase_game.get('rightTeam', {}).get('name')}")
+        # Pull the fields used below out once; leftTeam/rightTeam may be
+        # missing or null on older games
+        left_team = firebase_game.get('leftTeam') or {}
+        right_team = firebase_game.get('rightTeam') or {}
+        team1_name = left_team.get('name', 'Team 1')
+        team2_name = right_team.get('name', 'Team 2')
+        created_at = firebase_game.get('createdAt', '')
+        ended_at = firebase_game.get('endedAt')
+
+        logger.info(f"[GameSync] Step 1: Game found. Teams: {team1_name} vs {team2_name}")
 
         # Check if already synced
         if firebase_game.get('uballGameId'):
@@ -1823,7 +2196,7 @@ def sync_game_to_uball():
                 'message': 'Game already synced',
                 'uball_game_id': firebase_game['uballGameId'],
                 'firebase_game_id': firebase_game_id,
-                'video_name': f"{firebase_game.get('leftTeam', {}).get('name', 'Team 1')} vs {firebase_game.get('rightTeam', {}).get('name', 'Team 2')}"
+                'video_name': f"{team1_name} vs {team2_name}"
             })
 
         # 2. Check if game already exists in Uball by firebase_game_id
@@ -1843,101 +2216,86 @@ def sync_game_to_uball():
         logger.info(f"[GameSync] Step 3: Creating teams in Uball Backend...")
         teams_created = []
 
+        # Resolve both teams concurrently; each is a lookup plus a possible
+        # create against Uball, so doing them back to back doubles the wait
+        team_futures = []
         if not team1_id:
-            # Extract team1 name from Firebase (leftTeam)
-            left_team = firebase_game.get('leftTeam', {})
-            team1_name = left_team.get('name', 'Team 1')
-
-            resolved_team1 = uball_client.get_or_create_team(team1_name)
-            if not resolved_team1:
-                return jsonify({
-                    'success': False,
-                    'error': f'Failed to resolve team: {team1_name}'
-                }), 500
-
-            team1_id = str(resolved_team1.get('id'))
-            teams_created.append({'name': team1_name, 'id': team1_id, 'side': 'left'})
-            logger.info(f"[GameSync] Resolved team1: {team1_name} -> {team1_id}")
-
+            team_futures.append(('left', team1_name, _bg_executor.submit(uball_client.get_or_create_team, team1_name)))
         if not team2_id:
-            # Extract team2 name from Firebase (rightTeam)
-            right_team = firebase_game.get('rightTeam', {})
-            team2_name = right_team.get('name', 'Team 2')
+            team_futures.append(('right', team2_name, _bg_executor.submit(uball_client.get_or_create_team, team2_name)))
 
-            resolved_team2 = uball_client.get_or_create_team(team2_name)
-            if not resolved_team2:
+        for side, team_name, future in team_futures:
+            resolved_team = future.result()
+            if not resolved_team:
                 return jsonify({
                     'success': False,
-                    'error': f'Failed to resolve team: {team2_name}'
+                    'error': f'Failed to resolve team: {team_name}'
                 }), 500
 
-            team2_id = str(resolved_team2.get('id'))
-            teams_created.append({'name': team2_name, 'id': team2_id, 'side': 'right'})
-            logger.info(f"[GameSync] Resolved team2: {team2_name} -> {team2_id}")
+            team_id = str(resolved_team.get('id'))
+            if side == 'left':
+                team1_id = team_id
+            else:
+                team2_id = team_id
+            teams_created.append({'name': team_name, 'id': team_id, 'side': side})
+            logger.info(f"[GameSync] Resolved team{1 if side == 'left' else 2}: {team_name} -> {team_id}")
 
         # 4. Prepare game data for Uball Backend
         logger.info(f"[GameSync] Step 4: Preparing game data for Uball Backend...")
-        created_at = firebase_game.get('createdAt', '')
-        ended_at = firebase_game.get('endedAt')
-
-        # Extract date from createdAt (format: 2025-01-20T14:30:00Z)
-        game_date = created_at[:10] if created_at else datetime.now().strftime('%Y-%m-%d')
+        # Parse createdAt/endedAt once (format: 2025-01-20T14:30:00Z) so the
+        # date comes from a real timestamp and Uball gets normalized ISO-8601
+        start_time = end_time = None
+        try:
+            if created_at:
+                start_time = parse_iso8601(created_at)
+            if ended_at:
+                end_time = parse_iso8601(ended_at)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"[GameSync] Unparseable game timestamps ({created_at!r}, {ended_at!r}): {e}")
+        game_date = (start_time or datetime.now(timezone.utc)).date().isoformat()
 
         uball_game_data = {
             'firebase_game_id': firebase_game_id,
             'date': game_date,
             'team1_id': team1_id,
             'team2_id': team2_id,
-            'start_time': created_at if created_at else None,
-            'end_time': ended_at if ended_at else None,
-            'source': 'firebase'
+            'start_time': start_time.isoformat() if start_time else None,
+            'end_time': end_time.isoformat() if end_time else None,
+            'source': 'firebase',
+            # Set video_name as "TEAM1 vs TEAM2"
+            'video_name': f"{team1_name} vs {team2_name}",
         }
 
         # Add team colors (color name for annotation tool classify endpoint)
-        team1_color_name = left_team.get('jerseyColorName', '')
-        team2_color_name = right_team.get('jerseyColorName', '')
-        if team1_color_name:
-            uball_game_data['team1_color'] = team1_color_name
-        if team2_color_name:
-            uball_game_data['team2_color'] = team2_color_name
-        logger.info(f"[GameSync] Team colors: {team1_color_name} vs {team2_color_name}")
-
-        # Add scores and video_name from leftTeam/rightTeam
-        left_team = firebase_game.get('leftTeam', {})
-        right_team = firebase_game.get('rightTeam', {})
-
-        # Set video_name as "TEAM1 vs TEAM2"
-        team1_name = left_team.get('name', 'Team 1')
-        team2_name = right_team.get('name', 'Team 2')
-        uball_game_data['video_name'] = f"{team1_name} vs {team2_name}"
-
-        if left_team.get('finalScore') is not None:
-            uball_game_data['team1_score'] = left_team['finalScore']
-            # UBA-261: also snapshot the Firebase-authoritative finals into
-            # the immutable original_team{1,2}_score columns on the games
-            # row. team1_score / team2_score remain the "working" totals
-            # that get mutated by the annotation flow; original_* is the
-            # read-only reference EditorPage renders next to them so
-            # annotators can spot mistyped/missing stats.
-            uball_game_data['original_team1_score'] = left_team['finalScore']
-        if right_team.get('finalScore') is not None:
-            uball_game_data['team2_score'] = right_team['finalScore']
-            uball_game_data['original_team2_score'] = right_team['finalScore']
+        # and final scores from leftTeam/rightTeam
+        for team_key, team in (('team1', left_team), ('team2', right_team)):
+            color_name = team.get('jerseyColorName', '')
+            if color_name:
+                uball_game_data[f'{team_key}_color'] = color_name
+            final_score = team.get('finalScore')
+            if final_score is not None:
+                # UBA-261: also snapshot the Firebase-authoritative finals into
+                # the immutable original_team{1,2}_score columns on the games
+                # row. team1_score / team2_score remain the "working" totals
+                # that get mutated by the annotation flow; original_* is the
+                # read-only reference EditorPage renders next to them so
+                # annotators can spot mistyped/missing stats.
+                uball_game_data[f'{team_key}_score'] = final_score
+                uball_game_data[f'original_{team_key}_score'] = final_score
+        logger.info(f"[GameSync] Team colors: {uball_game_data.get('team1_color', '')} vs {uball_game_data.get('team2_color', '')}")
 
         # Legacy score format support
-        if firebase_game.get('score'):
-            score = firebase_game['score']
-            if isinstance(score, dict):
-                legacy_home = score.get('home', score.get('team1'))
-                legacy_away = score.get('away', score.get('team2'))
-                if legacy_home is not None:
-                    uball_game_data['team1_score'] = legacy_home
+        score = firebase_game.get('score')
+        if score and isinstance(score, dict):
+            for team_key, score_keys in _LEGACY_SCORE_KEYS:
+                # First key present wins, even if its value is None
+                key = next((k for k in score_keys if k in score), None)
+                legacy_score = score[key] if key else None
+                if legacy_score is not None:
+                    uball_game_data[f'{team_key}_score'] = legacy_score
                     # UBA-261: only seed original_* from legacy score if the
                     # primary leftTeam.finalScore path didn't already.
-                    uball_game_data.setdefault('original_team1_score', legacy_home)
-                if legacy_away is not None:
-                    uball_game_data['team2_score'] = legacy_away
-                    uball_game_data.setdefault('original_team2_score', legacy_away)
+                    uball_game_data.setdefault(f'original_{team_key}_score', legacy_score)
 
         # 4.5. Pass through roster and display names from Firebase game (check-in data)
         #
@@ -2033,9 +2391,7 @@ def sync_game_to_uball():
         return jsonify(response_data)
 
     except Exception as e:
-        logger.error(f"[GameSync] Error syncing game: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[GameSync] Error syncing game: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2047,6 +2403,10 @@ def get_game_recordings(game_id):
     """
     Get recording sessions that overlap with a specific game's time range.
 
+    Query params:
+        all_jetsons: 'true' to include sessions from every Jetson
+                     (default: only this Jetson's sessions)
+
     Returns:
         { success: true, recordings: [...] }
     """
@@ -2074,38 +2434,15 @@ def get_game_recordings(game_id):
                 'error': 'Game has no start time'
             }), 400
 
-        # Parse timestamps
-        from datetime import datetime
-        start = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-
-        if ended_at:
-            end = datetime.fromisoformat(ended_at.replace('Z', '+00:00'))
-        else:
-            # Game still in progress, use current time
-            end = datetime.now()
-
-        # Find overlapping recording sessions
-        recordings = firebase_service.get_games_in_timerange(start, end)
-
-        # Actually we need recording sessions, not games
-        # Let's get all recording sessions and filter by time overlap
-        all_sessions = firebase_service.get_recording_sessions(limit=100)
-
-        overlapping_sessions = []
-        for session in all_sessions:
-            session_start = session.get('startedAt')
-            session_end = session.get('endedAt')
-
-            if not session_start:
-                continue
-
-            # Check for overlap
-            s_start = datetime.fromisoformat(session_start.replace('Z', '+00:00'))
-            s_end = datetime.fromisoformat(session_end.replace('Z', '+00:00')) if session_end else datetime.now()
-
-            # Overlap if: session_start < game_end AND session_end > game_start
-            if s_start < end and s_end > start:
-                overlapping_sessions.append(session)
+        # Find overlapping recording sessions (ended_at of None means the
+        # game is still in progress, so the range runs up to now). Only this
+        # Jetson's sessions unless ?all_jetsons=true; the filter runs in
+        # Firestore.
+        all_jetsons = request.args.get('all_jetsons', 'false').lower() == 'true'
+        overlapping_sessions = firebase_service.get_sessions_overlapping(
+            created_at, ended_at or None,
+            jetson_id=None if all_jetsons else firebase_service.jetson_id
+        )
 
         return jsonify({
             'success': True,
@@ -2245,9 +2582,7 @@ def process_game_videos_endpoint():
             return jsonify(results), 500
 
     except Exception as e:
-        logger.error(f"[VideoProcessing] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[VideoProcessing] Error: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2257,13 +2592,14 @@ def process_game_videos_endpoint():
 def _run_video_processing_job(job_id: str, firebase_game_id: str, game_number: int, location: str):
     """Background worker for async video processing."""
     def update_progress(stage: str, detail: str = '', progress: float = 0, current_angle: str = ''):
-        with video_processing_lock:
-            if job_id in video_processing_jobs:
-                video_processing_jobs[job_id]['stage'] = stage
-                video_processing_jobs[job_id]['detail'] = detail
-                video_processing_jobs[job_id]['progress'] = progress
-                video_processing_jobs[job_id]['current_angle'] = current_angle
-                video_processing_jobs[job_id]['updated_at'] = datetime.now().isoformat()
+        _update_video_job(
+            job_id,
+            stage=stage,
+            detail=detail,
+            progress=progress,
+            current_angle=current_angle,
+            updated_at=datetime.now().isoformat(),
+        )
 
     try:
         update_progress('starting', 'Initializing video processing...', 0)
@@ -2281,33 +2617,34 @@ def _run_video_processing_job(job_id: str, firebase_game_id: str, game_number: i
             progress_callback=update_progress
         )
 
-        with video_processing_lock:
-            if job_id in video_processing_jobs:
-                video_processing_jobs[job_id]['status'] = 'completed' if results['success'] else 'failed'
-                video_processing_jobs[job_id]['result'] = results
-
-                # Handle skipped case (no videos found but not an error)
-                if results.get('skipped'):
-                    video_processing_jobs[job_id]['stage'] = 'skipped'
-                    video_processing_jobs[job_id]['detail'] = results.get('skip_reason', 'No videos to process')
-                else:
-                    video_processing_jobs[job_id]['stage'] = 'completed' if results['success'] else 'failed'
-                    video_processing_jobs[job_id]['detail'] = 'Processing complete' if results['success'] else 'Processing failed'
-
-                video_processing_jobs[job_id]['progress'] = 100 if results['success'] else 0
-                video_processing_jobs[job_id]['completed_at'] = datetime.now().isoformat()
+        # Handle skipped case (no videos found but not an error)
+        if results.get('skipped'):
+            stage = 'skipped'
+            detail = results.get('skip_reason', 'No videos to process')
+        else:
+            stage = 'completed' if results['success'] else 'failed'
+            detail = 'Processing complete' if results['success'] else 'Processing failed'
+
+        _update_video_job(
+            job_id,
+            status='completed' if results['success'] else 'failed',
+            result=results,
+            stage=stage,
+            detail=detail,
+            progress=100 if results['success'] else 0,
+            completed_at=datetime.now().isoformat(),
+        )
 
     except Exception as e:
-        logger.error(f"[VideoProcessing] Job {job_id} failed: {e}")
-        import traceback
-        traceback.print_exc()
-        with video_processing_lock:
-            if job_id in video_processing_jobs:
-                video_processing_jobs[job_id]['status'] = 'failed'
-                video_processing_jobs[job_id]['stage'] = 'error'
-                video_processing_jobs[job_id]['detail'] = str(e)
-                video_processing_jobs[job_id]['error'] = str(e)
-                video_processing_jobs[job_id]['completed_at'] = datetime.now().isoformat()
+        logger.exception(f"[VideoProcessing] Job {job_id} failed: {e}")
+        _update_video_job(
+            job_id,
+            status='failed',
+            stage='error',
+            detail=str(e),
+            error=str(e),
+            completed_at=datetime.now().isoformat(),
+        )
 
 
 @app.route('/api/games/process-videos/async', methods=['POST'])
@@ -2355,23 +2692,22 @@ def process_game_videos_async():
         # Create job
         job_id = str(uuid.uuid4())
 
-        with video_processing_lock:
-            video_processing_jobs[job_id] = {
-                'job_id': job_id,
-                'firebase_game_id': firebase_game_id,
-                'game_number': game_number,
-                'location': location,
-                'transcode_mode': 'aws_batch',
-                'status': 'running',
-                'stage': 'queued',
-                'detail': 'Job queued',
-                'progress': 0,
-                'current_angle': '',
-                'created_at': datetime.now().isoformat(),
-                'updated_at': datetime.now().isoformat(),
-                'result': None,
-                'error': None
-            }
+        _add_video_job({
+            'job_id': job_id,
+            'firebase_game_id': firebase_game_id,
+            'game_number': game_number,
+            'location': location,
+            'transcode_mode': 'aws_batch',
+            'status': 'running',
+            'stage': 'queued',
+            'detail': 'Job queued',
+            'progress': 0,
+            'current_angle': '',
+            'created_at': datetime.now().isoformat(),
+            'updated_at': datetime.now().isoformat(),
+            'result': None,
+            'error': None
+        })
 
         # Start background thread
         thread = threading.Thread(
@@ -2414,8 +2750,8 @@ def get_video_processing_status(job_id):
         "result": {...}  // Only when completed
     }
     """
-    with video_processing_lock:
-        job = video_processing_jobs.get(job_id)
+    # No lock needed: job dicts are replaced, never mutated
+    job = video_processing_jobs.get(job_id)
 
     if not job:
         return jsonify({
@@ -2465,11 +2801,12 @@ def get_video_processing_status(job_id):
 @app.route('/api/games/process-videos/jobs', methods=['GET'])
 def list_video_processing_jobs():
     """List all video processing jobs."""
-    with video_processing_lock:
-        jobs = list(video_processing_jobs.values())
+    # Snapshot without the lock; copying the values view is a single C-level
+    # operation and the job dicts themselves are never mutated
+    jobs = list(video_processing_jobs.copy().values())
 
-    # Sort by created_at descending
-    jobs.sort(key=lambda j: j['created_at'], reverse=True)
+    # Last 20 jobs by created_at, newest first
+    recent_jobs = heapq.nlargest(20, jobs, key=itemgetter('created_at'))
 
     return jsonify({
         'success': True,
@@ -2482,7 +2819,7 @@ def list_video_processing_jobs():
             'stage': j['stage'],
             'progress': j['progress'],
             'created_at': j['created_at']
-        } for j in jobs[:20]]  # Last 20 jobs
+        } for j in recent_jobs]
     })
 
 
@@ -2534,61 +2871,68 @@ def preview_game_extraction(game_id):
             }), 400
 
         # Parse timestamps
-        game_start = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-        game_end = datetime.fromisoformat(ended_at.replace('Z', '+00:00')) if ended_at else datetime.now(game_start.tzinfo)
+        game_start = parse_iso8601(created_at)
+        game_end = parse_iso8601(ended_at) if ended_at else datetime.now(game_start.tzinfo)
         game_duration = (game_end - game_start).total_seconds()
 
         # Find overlapping sessions - get ALL sessions (from all Jetsons) for preview
         # Processing will filter by jetson_id, but preview shows the full picture
         this_jetson_id = os.getenv('JETSON_ID', 'unknown')
         logger.info(f"[VideoProcessing] Preview for game {game_id} (this Jetson: {this_jetson_id})")
-        all_sessions = firebase_service.get_recording_sessions(limit=100)  # No jetson_id filter for preview
-        logger.info(f"[VideoProcessing] Found {len(all_sessions)} total sessions across all Jetsons")
+        overlapping = firebase_service.get_sessions_overlapping(game_start, game_end if ended_at else None)  # No jetson_id filter for preview
+        logger.info(f"[VideoProcessing] Found {len(overlapping)} overlapping sessions across all Jetsons")
         session_previews = []
 
-        for session in all_sessions:
+        # Get chapters (only available if session is on this Jetson). Each
+        # chapter is ffprobed, so probe the local sessions concurrently.
+        local_names = {
+            session.get('segmentSession', '') for session in overlapping
+            if session.get('jetsonId', 'unknown') == this_jetson_id
+        }
+        chapters_by_session = {}
+        if local_names:
+            with ThreadPoolExecutor(max_workers=min(len(local_names), 8),
+                                    thread_name_prefix='chapter-probe') as executor:
+                futures = {executor.submit(video_processor.get_session_chapters, name): name
+                           for name in local_names}
+                for future in as_completed(futures):
+                    chapters_by_session[futures[future]] = future.result()
+
+        for session in overlapping:
             session_start_str = session.get('startedAt')
             session_end_str = session.get('endedAt')
+            s_start = parse_iso8601(session_start_str)
 
-            if not session_start_str:
-                continue
-
-            s_start = datetime.fromisoformat(session_start_str.replace('Z', '+00:00'))
-            s_end = datetime.fromisoformat(session_end_str.replace('Z', '+00:00')) if session_end_str else datetime.now(s_start.tzinfo)
-
-            # Check overlap
-            if s_start < game_end and s_end > game_start:
-                session_name = session.get('segmentSession', '')
-                angle_code = session.get('angleCode', 'UNKNOWN')
-                session_jetson_id = session.get('jetsonId', 'unknown')
-                is_local = (session_jetson_id == this_jetson_id)
+            session_name = session.get('segmentSession', '')
+            angle_code = session.get('angleCode', 'UNKNOWN')
+            session_jetson_id = session.get('jetsonId', 'unknown')
+            is_local = (session_jetson_id == this_jetson_id)
 
-                # Get chapters (only available if session is on this Jetson)
-                chapters = video_processor.get_session_chapters(session_name) if is_local else []
+            chapters = chapters_by_session.get(session_name, []) if is_local else []
 
-                # Calculate extraction params
-                if chapters:
-                    params = video_processor.calculate_extraction_params(
-                        game_start, game_end, s_start, chapters
-                    )
+            # Calculate extraction params
+            if chapters:
+                params = video_processor.calculate_extraction_params(
+                    game_start, game_end, s_start, chapters
+                )
+            else:
+                if is_local:
+                    params = {'error': 'No chapters found locally'}
                 else:
-                    if is_local:
-                        params = {'error': 'No chapters found locally'}
-                    else:
-                        params = {'error': f'Session on {session_jetson_id} (process from that Jetson)'}
-
-                session_previews.append({
-                    'session_id': session.get('id'),
-                    'segment_session': session_name,
-                    'angle': angle_code,
-                    'jetson_id': session_jetson_id,
-                    'is_local': is_local,
-                    'session_start': session_start_str,
-                    'session_end': session_end_str,
-                    'chapters_count': len(chapters),
-                    'chapters': chapters,
-                    'extraction_params': params
-                })
+                    params = {'error': f'Session on {session_jetson_id} (process from that Jetson)'}
+
+            session_previews.append({
+                'session_id': session.get('id'),
+                'segment_session': session_name,
+                'angle': angle_code,
+                'jetson_id': session_jetson_id,
+                'is_local': is_local,
+                'session_start': session_start_str,
+                'session_end': session_end_str,
+                'chapters_count': len(chapters),
+                'chapters': chapters,
+                'extraction_params': params
+            })
 
         # Build response matching frontend ExtractionPreviewResponse type
         issues = []
@@ -2602,16 +2946,15 @@ def preview_game_extraction(game_id):
         for sp in session_previews:
             extraction_params = sp.get('extraction_params', {})
             chapters_raw = sp.get('chapters', [])
-            formatted_chapters = []
-            for ch in chapters_raw:
-                if isinstance(ch, dict):
-                    formatted_chapters.append(ch)
-                elif isinstance(ch, str):
-                    formatted_chapters.append({
-                        'filename': ch,
-                        'size_mb': 0,
-                        'duration_str': 'unknown'
-                    })
+            # get_session_chapters returns chapter dicts, which are used as-is;
+            # bare filenames (older callers) get placeholder fields
+            if not chapters_raw or isinstance(chapters_raw[0], dict):
+                formatted_chapters = chapters_raw
+            else:
+                formatted_chapters = [
+                    {'filename': ch, 'size_mb': 0, 'duration_str': 'unknown'}
+                    for ch in chapters_raw if isinstance(ch, str)
+                ]
 
             formatted_sessions.append({
                 'session_id': sp.get('session_id', ''),
@@ -2647,15 +2990,52 @@ def preview_game_extraction(game_id):
         })
 
     except Exception as e:
-        logger.error(f"[VideoProcessing] Preview error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[VideoProcessing] Preview error: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
 
+# AWS Batch describe_jobs accepts at most this many job IDs per call
+DESCRIBE_JOBS_BATCH_SIZE = 100
+# Concurrent S3 HEAD checks per register run (matches the client's pool)
+BATCH_REGISTER_HEAD_WORKERS = 32
+
+# Transcode output keys: {location}/{date}/{uuid4}/{filename}; group 1 is the
+# partial game UUID folder
+_BATCH_OUTPUT_KEY_RE = re.compile(r'^[^/]*/[^/]*/([^/]*)/')
+
+# Batch job ID -> 'registered' or 'ignored' (not an FL/FR output) for jobs
+# settled on an earlier run. A finished job's environment never changes, so
+# these are skipped without describe_jobs, S3 or Uball calls. Jobs whose
+# output is missing or whose registration failed are retried every run.
+_batch_register_outcomes = {}
+_batch_register_outcomes_lock = threading.Lock()
+
+# AWS clients for register_completed_batch_jobs, built on first use and kept
+# so each cron call reuses their credentials and warm connection pools
+_batch_register_clients = None
+_batch_register_clients_lock = threading.Lock()
+
+
+def _get_batch_register_clients():
+    """Return the shared (batch, s3) clients, creating them once"""
+    global _batch_register_clients
+    with _batch_register_clients_lock:
+        if _batch_register_clients is None:
+            boto_config = BotoConfig(
+                retries={'max_attempts': 3},
+                max_pool_connections=32,
+                tcp_keepalive=True,
+            )
+            _batch_register_clients = (
+                boto3.client('batch', region_name='us-east-1', config=boto_config),
+                boto3.client('s3', region_name='us-east-1', config=boto_config),
+            )
+        return _batch_register_clients
+
+
 @app.route('/api/batch/register-completed', methods=['POST'])
 def register_completed_batch_jobs():
     """
@@ -2678,13 +3058,7 @@ def register_completed_batch_jobs():
         }), 503
 
     try:
-        import boto3
-        from botocore.config import Config as BotoConfig
-
-        # Initialize AWS clients
-        boto_config = BotoConfig(retries={'max_attempts': 3})
-        batch_client = boto3.client('batch', region_name='us-east-1', config=boto_config)
-        s3_client = boto3.client('s3', region_name='us-east-1', config=boto_config)
+        batch_client, s3_client = _get_batch_register_clients()
 
         bucket = os.getenv('UPLOAD_BUCKET', 'uball-videos-production')
         job_queue = os.getenv('AWS_BATCH_JOB_QUEUE', 'gpu-transcode-queue')
@@ -2700,48 +3074,72 @@ def register_completed_batch_jobs():
         logger.info(f"[BatchRegister] Found {len(jobs)} succeeded Batch jobs")
 
         registered = 0
-        already_registered = 0
         errors = []
 
-        for job_summary in jobs:
-            job_id = job_summary['jobId']
-
-            # Get job details to find output S3 key
-            job_detail = batch_client.describe_jobs(jobs=[job_id])
-            if not job_detail.get('jobs'):
-                continue
+        # Jobs settled on an earlier run are skipped without describing them
+        job_ids = [job_summary['jobId'] for job_summary in jobs]
+        outcomes = {}
+        with _batch_register_outcomes_lock:
+            for job_id in job_ids:
+                if job_id in _batch_register_outcomes:
+                    outcomes[job_id] = _batch_register_outcomes[job_id]
+        already_registered = sum(1 for outcome in outcomes.values() if outcome == 'registered')
+        new_job_ids = [job_id for job_id in job_ids if job_id not in outcomes]
+
+        # Get job details to find output S3 keys; describe_jobs takes up to
+        # 100 job IDs per call, so this is one round trip instead of one per job
+        job_details = []
+        for i in range(0, len(new_job_ids), DESCRIBE_JOBS_BATCH_SIZE):
+            job_details.extend(
+                batch_client.describe_jobs(jobs=new_job_ids[i:i + DESCRIBE_JOBS_BATCH_SIZE]).get('jobs', [])
+            )
 
-            job = job_detail['jobs'][0]
+        candidates = []
+        for job in job_details:
             env_vars = {e['name']: e['value'] for e in job.get('container', {}).get('environment', [])}
 
             output_key = env_vars.get('OUTPUT_S3_KEY', '')
             angle = env_vars.get('ANGLE', '')
 
             # Only register FL and FR
-            if angle not in ['FL', 'FR']:
+            if angle not in ['FL', 'FR'] or not output_key:
+                outcomes[job['jobId']] = 'ignored'
                 continue
 
-            if not output_key:
-                continue
+            candidates.append((job['jobId'], env_vars, output_key, angle))
 
-            # Check if file exists in S3
+        def _s3_exists(key):
             try:
-                s3_client.head_object(Bucket=bucket, Key=output_key)
-            except:
+                s3_client.head_object(Bucket=bucket, Key=key)
+                return True
+            except Exception:
+                return False
+
+        # Check which outputs exist in S3, all at once rather than one
+        # HEAD round trip after another
+        exists = []
+        if candidates:
+            with ThreadPoolExecutor(max_workers=min(len(candidates), BATCH_REGISTER_HEAD_WORKERS),
+                                    thread_name_prefix='s3-head') as executor:
+                exists = list(executor.map(_s3_exists, [c[2] for c in candidates]))
+
+        for (job_id, env_vars, output_key, angle), output_exists in zip(candidates, exists):
+            if not output_exists:
                 continue  # File doesn't exist
 
             # Get game_id from Batch job environment (full UUID)
             game_id = env_vars.get('GAME_ID', '')
             if not game_id:
                 # Fallback: parse from S3 path (less reliable)
-                parts = output_key.split('/')
-                if len(parts) >= 4:
-                    game_id = parts[2]  # Partial UUID from path
+                key_match = _BATCH_OUTPUT_KEY_RE.match(output_key)
+                if key_match:
+                    game_id = key_match.group(1)  # Partial UUID from path
                 else:
+                    outcomes[job_id] = 'ignored'
                     continue
 
             # Get filename from S3 path
-            filename = output_key.split('/')[-1]
+            filename = output_key.rpartition('/')[2]
             uball_angle = 'LEFT' if angle == 'FL' else 'RIGHT'
 
             # Try to register (will fail gracefully if already registered)
@@ -2756,16 +3154,25 @@ def register_completed_batch_jobs():
 
                 if result:
                     registered += 1
+                    outcomes[job_id] = 'registered'
                     logger.info(f"[BatchRegister] Registered {angle} for game {game_id}: {output_key}")
                 else:
                     already_registered += 1
             except Exception as e:
                 error_msg = str(e)
-                if 'duplicate' in error_msg.lower() or 'already exists' in error_msg.lower():
+                lowered = error_msg.lower()
+                if 'duplicate' in lowered or 'already exists' in lowered:
                     already_registered += 1
+                    outcomes[job_id] = 'registered'
                 else:
                     errors.append({'key': output_key, 'error': error_msg})
 
+        # Remember settled jobs; anything that has dropped out of list_jobs
+        # won't come back, so only the current window is kept
+        with _batch_register_outcomes_lock:
+            _batch_register_outcomes.clear()
+            _batch_register_outcomes.update(outcomes)
+
         return jsonify({
             'success': True,
             'registered': registered,
@@ -2775,9 +3182,7 @@ def register_completed_batch_jobs():
         })
 
     except Exception as e:
-        logger.error(f"[BatchRegister] Error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[BatchRegister] Error: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -2883,8 +3288,6 @@ def cv_dispatch_pending():
         dispatcher = CVBatchDispatcher(emit_target=emit_target)
 
         # Shared S3 client for the HEAD-check pre-flight.
-        import boto3
-        from botocore.config import Config as BotoConfig
         boto_config = BotoConfig(retries={'max_attempts': 2, 'mode': 'adaptive'},
                                  max_pool_connections=1)
         s3 = boto3.client('s3', region_name=dispatcher.region,
@@ -3024,9 +3427,7 @@ def cv_dispatch_pending():
         })
 
     except Exception as e:
-        logger.error(f"[CVDispatch] unhandled error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[CVDispatch] unhandled error: {e}")
         try:
             import cv_metrics
             cv_metrics.emit('CVDispatchUnhandledError', 1, dimensions={'Stage': 'dispatch'})
@@ -3035,6 +3436,11 @@ def cv_dispatch_pending():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+# Checked in order; the first missing one is reported
+_REGISTER_VIDEO_REQUIRED_FIELDS = ('firebase_game_id', 's3_key', 'filename')
+# Only these angles are registered in Uball
+_UBALL_ANGLE_CODES = frozenset(('FL', 'FR'))
+
 @app.route('/api/games/register-video', methods=['POST'])
 def register_video_in_uball():
     """
@@ -3064,23 +3470,15 @@ def register_video_in_uball():
 
     try:
         data = request.get_json()
-        if not data:
+        if not data or not isinstance(data, dict):
             return jsonify({'success': False, 'error': 'Request body required'}), 400
 
-        firebase_game_id = data.get('firebase_game_id')
-        s3_key = data.get('s3_key')
-        angle_code = data.get('angle_code', '').upper()
-        filename = data.get('filename')
-        duration = data.get('duration')
-        file_size = data.get('file_size')
+        missing = next((key for key in _REGISTER_VIDEO_REQUIRED_FIELDS if not data.get(key)), None)
+        if missing:
+            return jsonify({'success': False, 'error': f'{missing} required'}), 400
 
-        if not firebase_game_id:
-            return jsonify({'success': False, 'error': 'firebase_game_id required'}), 400
-        if not s3_key:
-            return jsonify({'success': False, 'error': 's3_key required'}), 400
-        if not filename:
-            return jsonify({'success': False, 'error': 'filename required'}), 400
-        if angle_code not in ['FL', 'FR']:
+        angle_code = str(data.get('angle_code') or '').upper()
+        if angle_code not in _UBALL_ANGLE_CODES:
             return jsonify({
                 'success': False,
                 'error': 'angle_code must be FL or FR (only these angles are registered in Uball)'
@@ -3088,12 +3486,12 @@ def register_video_in_uball():
 
         # Register the video
         result = uball_client.register_game_video(
-            firebase_game_id=firebase_game_id,
-            s3_key=s3_key,
+            firebase_game_id=data['firebase_game_id'],
+            s3_key=data['s3_key'],
             angle_code=angle_code,
-            filename=filename,
-            duration=duration,
-            file_size=file_size,
+            filename=data['filename'],
+            duration=data.get('duration'),
+            file_size=data.get('file_size'),
             s3_bucket=UPLOAD_BUCKET
         )
 
@@ -3163,6 +3561,18 @@ def get_game_videos_from_uball(game_id):
         }), 500
 
 
+def _safe_video_path(filename):
+    """Resolve filename inside VIDEO_STORAGE_DIR.
+
+    Returns the canonical path, or None if it escapes the storage directory
+    (via '..' or a symlink). A plain startswith() on the joined path would
+    also accept siblings such as ~/gopro_videosX/.
+    """
+    path = (_VIDEO_ROOT / filename).resolve()
+    if path == _VIDEO_ROOT or not path.is_relative_to(_VIDEO_ROOT):
+        return None
+    return str(path)
+
 @app.route('/api/videos', methods=['GET'])
 def list_videos():
     """List all recorded videos"""
@@ -3177,34 +3587,50 @@ def list_videos():
 def delete_video(filename):
     """Delete a specific video"""
     try:
-        video_path = os.path.join(VIDEO_STORAGE_DIR, filename)
-        if os.path.exists(video_path) and video_path.startswith(VIDEO_STORAGE_DIR):
-            os.remove(video_path)
-            return jsonify({
-                'success': True,
-                'message': f'Video {filename} deleted'
-            })
-        else:
-            return jsonify({
-                'success': False,
-                'error': 'Video not found'
-            }), 404
+        video_path = _safe_video_path(filename)
+        if not video_path:
+            raise FileNotFoundError(filename)
+        os.remove(video_path)
+        invalidate_video_list_cache()
+        return jsonify({
+            'success': True,
+            'message': f'Video {filename} deleted'
+        })
+    except FileNotFoundError:
+        return jsonify({
+            'success': False,
+            'error': 'Video not found'
+        }), 404
     except Exception as e:
         return jsonify({
             'success': False,
             'error': str(e)
         }), 500
 
+# statvfs for system_info, reused for STATVFS_CACHE_TTL seconds between polls
+STATVFS_CACHE_TTL = 1.0
+_statvfs_cache = {'ts': 0.0, 'val': None}
+
+def _get_storage_statvfs():
+    """os.statvfs(VIDEO_STORAGE_DIR), cached briefly for frequent pollers"""
+    now = time.monotonic()
+    cached = _statvfs_cache['val']
+    if cached is not None and now - _statvfs_cache['ts'] < STATVFS_CACHE_TTL:
+        return cached
+    val = os.statvfs(VIDEO_STORAGE_DIR)
+    _statvfs_cache['val'] = val
+    _statvfs_cache['ts'] = now
+    return val
+
 @app.route('/api/system/info', methods=['GET'])
 def system_info():
     """Get system information"""
     try:
-        stat = os.statvfs(VIDEO_STORAGE_DIR)
+        stat = _get_storage_statvfs()
         free_space_gb = (stat.f_bavail * stat.f_frsize) / (1024**3)
         total_space_gb = (stat.f_blocks * stat.f_frsize) / (1024**3)
 
-        videos = get_video_list()
-        total_video_size_mb = sum(v['size_mb'] for v in videos)
+        video_count, total_video_size_mb = get_video_stats()
 
         return jsonify({
             'success': True,
@@ -3213,7 +3639,7 @@ def system_info():
                 'storage_path': VIDEO_STORAGE_DIR,
                 'disk_free_gb': round(free_space_gb, 2),
                 'disk_total_gb': round(total_space_gb, 2),
-                'video_count': len(videos),
+                'video_count': video_count,
                 'total_video_size_mb': round(total_video_size_mb, 2)
             }
         })
@@ -3227,7 +3653,10 @@ def system_info():
 @app.route('/api/system/ntp', methods=['GET'])
 def get_ntp_status():
     """
-    Check NTP synchronization status using chronyc.
+    Check NTP synchronization status from chronyd.
+
+    Asks chronyd directly over its command socket; falls back to parsing
+    `chronyc tracking` if the socket can't be reached.
 
     Returns:
         JSON with NTP sync info:
@@ -3238,75 +3667,28 @@ def get_ntp_status():
         - warning: Present if offset > 500ms
     """
     try:
-        result = subprocess.run(
-            ['chronyc', 'tracking'],
-            capture_output=True,
-            text=True,
-            timeout=5
-        )
-
-        if result.returncode != 0:
-            # chronyc not available or failed
-            return jsonify({
-                'success': True,
-                'synced': False,
-                'error': 'chronyc command failed or not available',
-                'stderr': result.stderr
-            })
+        tracking = query_tracking()
+        if tracking is None:
+            result = subprocess.run(
+                ['chronyc', 'tracking'],
+                capture_output=True,
+                text=True,
+                timeout=5
+            )
 
-        output = result.stdout
-        response = {
-            'success': True,
-            'synced': False,
-            'offset_ms': None,
-            'stratum': None,
-            'source': None,
-            'raw_output': output
-        }
+            if result.returncode != 0:
+                # chronyc not available or failed
+                return jsonify({
+                    'success': True,
+                    'synced': False,
+                    'error': 'chronyc command failed or not available',
+                    'stderr': result.stderr
+                })
 
-        # Parse chronyc tracking output
-        for line in output.split('\n'):
-            line = line.strip()
-
-            # Reference ID line: "Reference ID    : 203.0.113.1 (time.example.com)"
-            if line.startswith('Reference ID'):
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    source_part = parts[1].strip()
-                    # Extract the hostname/IP from parentheses if present
-                    if '(' in source_part and ')' in source_part:
-                        response['source'] = source_part.split('(')[1].split(')')[0]
-                    else:
-                        response['source'] = source_part.split()[0] if source_part else None
+            tracking = parse_tracking_output(result.stdout)
+            tracking['raw_output'] = result.stdout
 
-            # Stratum line: "Stratum         : 2"
-            elif line.startswith('Stratum'):
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    try:
-                        response['stratum'] = int(parts[1].strip())
-                    except ValueError:
-                        pass
-
-            # System time line: "System time     : 0.000012345 seconds fast of NTP time"
-            elif line.startswith('System time'):
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    time_part = parts[1].strip()
-                    # Extract the seconds value
-                    try:
-                        seconds_str = time_part.split()[0]
-                        offset_seconds = float(seconds_str)
-                        response['offset_ms'] = round(offset_seconds * 1000, 3)
-                    except (ValueError, IndexError):
-                        pass
-
-            # Leap status line: "Leap status     : Normal"
-            elif line.startswith('Leap status'):
-                parts = line.split(':', 1)
-                if len(parts) > 1:
-                    leap_status = parts[1].strip()
-                    response['synced'] = leap_status.lower() == 'normal'
+        response = {'success': True, **tracking}
 
         # Add warning if offset is too high
         if response['offset_ms'] is not None and abs(response['offset_ms']) > 500:
@@ -3336,10 +3718,9 @@ def get_ntp_status():
 def debug_env():
     """Debug endpoint to check environment variables."""
     angle_map_str = os.getenv('CAMERA_ANGLE_MAP', '{}')
-    try:
-        angle_map = json.loads(angle_map_str)
-    except:
-        angle_map = None
+    # The map _get_angle_code_from_camera_name actually uses, parsed once
+    # per distinct env value ({} if the JSON is invalid)
+    angle_map = _get_camera_angle_map()
 
     # Test the actual function from main.py
     test_result_main = _get_angle_code_from_camera_name('Backbone 1')
@@ -3362,24 +3743,37 @@ def debug_env():
     })
 
 
+def _accel_redirect_response(filename, as_attachment=False):
+    """Hand the file off to a fronting nginx via X-Accel-Redirect.
+
+    Only used when VIDEO_ACCEL_REDIRECT_PREFIX is set, e.g. '/internal/videos/'
+    mapped by an `internal` nginx location aliased to VIDEO_STORAGE_DIR. nginx
+    then serves the bytes (and Range requests) with sendfile(2) and the Flask
+    worker is released immediately.
+    """
+    response = Response(mimetype='video/mp4')
+    response.headers['X-Accel-Redirect'] = VIDEO_ACCEL_REDIRECT_PREFIX + quote(filename)
+    if as_attachment:
+        response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
 @app.route('/api/videos/<filename>/download', methods=['GET'])
 def download_video(filename):
     """Download a specific video file"""
     try:
-        video_path = os.path.join(VIDEO_STORAGE_DIR, filename)
-        
-        if not os.path.exists(video_path):
-            return jsonify({
-                'success': False,
-                'error': 'Video not found'
-            }), 404
-            
-        if not video_path.startswith(VIDEO_STORAGE_DIR):
+        video_path = _safe_video_path(filename)
+        if not video_path:
             return jsonify({
                 'success': False,
                 'error': 'Invalid file path'
             }), 403
-        
+
+        if VIDEO_ACCEL_REDIRECT_PREFIX:
+            # Check here, or a missing file gets nginx's 404 page instead of ours
+            if not os.path.isfile(video_path):
+                raise FileNotFoundError(video_path)
+            return _accel_redirect_response(filename, as_attachment=True)
+
         return send_file(
             video_path,
             as_attachment=True,
@@ -3387,6 +3781,12 @@ def download_video(filename):
             mimetype='video/mp4'
         )
         
+    except FileNotFoundError:
+        # Raised by send_file's own stat() when the video doesn't exist
+        return jsonify({
+            'success': False,
+            'error': 'Video not found'
+        }), 404
     except Exception as e:
         return jsonify({
             'success': False,
@@ -3397,54 +3797,35 @@ def download_video(filename):
 def stream_video(filename):
     """Stream a specific video file with support for range requests"""
     try:
-        video_path = os.path.join(VIDEO_STORAGE_DIR, filename)
-        
-        if not os.path.exists(video_path):
-            return jsonify({
-                'success': False,
-                'error': 'Video not found'
-            }), 404
-            
-        if not video_path.startswith(VIDEO_STORAGE_DIR):
+        video_path = _safe_video_path(filename)
+        if not video_path:
             return jsonify({
                 'success': False,
                 'error': 'Invalid file path'
             }), 403
-        
-        file_size = os.path.getsize(video_path)
-        range_header = request.headers.get('Range', None)
-        
-        if not range_header:
-            return send_file(
-                video_path,
-                mimetype='video/mp4',
-                conditional=True
-            )
-        
-        byte_range = range_header.replace('bytes=', '').split('-')
-        start = int(byte_range[0]) if byte_range[0] else 0
-        end = int(byte_range[1]) if byte_range[1] else file_size - 1
-        
-        end = min(end, file_size - 1)
-        length = end - start + 1
-        
-        with open(video_path, 'rb') as f:
-            f.seek(start)
-            data = f.read(length)
-        
-        response = Response(
-            data,
-            206,
+
+        if VIDEO_ACCEL_REDIRECT_PREFIX:
+            # Check here, or a missing file gets nginx's 404 page instead of ours
+            if not os.path.isfile(video_path):
+                raise FileNotFoundError(video_path)
+            return _accel_redirect_response(filename)
+
+        # send_file handles Range/If-Range itself (RFC 7233) and hands the
+        # file to wsgi.file_wrapper, so ranges are streamed rather than read
+        # into memory, and sendfile(2) is used when the server supports it.
+        return send_file(
+            video_path,
             mimetype='video/mp4',
-            direct_passthrough=True
+            conditional=True,
+            etag=True
         )
         
-        response.headers.add('Content-Range', f'bytes {start}-{end}/{file_size}')
-        response.headers.add('Accept-Ranges', 'bytes')
-        response.headers.add('Content-Length', str(length))
-        
-        return response
-        
+    except FileNotFoundError:
+        # Raised by send_file's own stat() when the video doesn't exist
+        return jsonify({
+            'success': False,
+            'error': 'Video not found'
+        }), 404
     except Exception as e:
         return jsonify({
             'success': False,
@@ -3455,6 +3836,46 @@ def stream_video(filename):
 
 media_service = get_media_service(VIDEO_STORAGE_DIR)
 
+# Thumbnails fetched from the cameras, reused for GOPRO_THUMBNAIL_CACHE_TTL so
+# a media grid that re-renders doesn't pull every JPEG over USB again.
+# Insertion-ordered; the oldest entry is dropped past GOPRO_THUMBNAIL_CACHE_MAX.
+GOPRO_THUMBNAIL_CACHE_TTL = 600  # seconds
+GOPRO_THUMBNAIL_CACHE_MAX = 256
+_gopro_thumbnail_cache = {}  # (gopro_id, directory, filename) -> (monotonic ts, stamp, jpeg)
+# gopro_id -> {(directory, filename): (size, mod)} from the camera's last media
+# listing. File numbering restarts at 100GOPRO/GX010001.MP4 after an SD card
+# format, so a cached thumbnail is only trusted while its stamp still matches.
+_gopro_media_stamps = {}
+_gopro_thumbnail_cache_lock = threading.Lock()
+
+
+def _refresh_gopro_media_stamps(gopro_id, files):
+    """Record a camera's media listing and drop thumbnails of files that changed"""
+    stamps = {
+        (f['directory'], f['filename']): (f['size_bytes'], f['modified_timestamp'])
+        for f in files
+    }
+    with _gopro_thumbnail_cache_lock:
+        _gopro_media_stamps[gopro_id] = stamps
+        stale = [
+            key for key, (_, stamp, _) in _gopro_thumbnail_cache.items()
+            if key[0] == gopro_id and stamps.get(key[1:]) != stamp
+        ]
+        for key in stale:
+            del _gopro_thumbnail_cache[key]
+
+
+def _forget_gopro_thumbnails(gopro_id, directory=None, filename=None):
+    """Drop cached thumbnails for one file, or for every file on the camera"""
+    with _gopro_thumbnail_cache_lock:
+        if directory is not None:
+            _gopro_thumbnail_cache.pop((gopro_id, directory, filename), None)
+            _gopro_media_stamps.get(gopro_id, {}).pop((directory, filename), None)
+            return
+        _gopro_media_stamps.pop(gopro_id, None)
+        for key in [key for key in _gopro_thumbnail_cache if key[0] == gopro_id]:
+            del _gopro_thumbnail_cache[key]
+
 @app.route('/api/media/gopro/<gopro_id>/files', methods=['GET'])
 def get_gopro_files_list(gopro_id):
     """Get list of all files on a specific GoPro"""
@@ -3463,6 +3884,8 @@ def get_gopro_files_list(gopro_id):
         return jsonify({'success': False, 'error': 'GoPro not found or not connected'}), 404
 
     result = media_service.get_gopro_media_list(gopro_ip)
+    if result['success']:
+        _refresh_gopro_media_stamps(gopro_id, result['files'])
     return jsonify(result), 200 if result['success'] else 500
 
 @app.route('/api/media/gopro/<gopro_id>/storage', methods=['GET'])
@@ -3493,6 +3916,8 @@ def delete_gopro_file_endpoint(gopro_id, directory, filename):
         return jsonify({'success': False, 'error': 'GoPro not found or not connected'}), 404
 
     result = media_service.delete_gopro_file(gopro_ip, directory, filename)
+    if result['success']:
+        _forget_gopro_thumbnails(gopro_id, directory, filename)
     return jsonify(result), 200 if result['success'] else 500
 
 @app.route('/api/media/gopro/<gopro_id>/files/all', methods=['DELETE'])
@@ -3511,8 +3936,26 @@ def delete_all_gopro_files_endpoint(gopro_id):
         }), 400
 
     result = media_service.delete_gopro_all_files(gopro_ip)
+    if result['success']:
+        _forget_gopro_thumbnails(gopro_id)
     return jsonify(result), 200 if result['success'] else 500
 
+def _proxy_gopro_body(response):
+    """Relay a streamed GoPro response body to the client.
+
+    Reads straight from the urllib3 response with read1(), which returns
+    whatever has arrived (up to 1MB) in one call, instead of iter_content's
+    generator stack and fixed 64KB chunks. The connection goes back to
+    _gopro_session's pool once the body is done or the client disconnects.
+    """
+    raw = response.raw
+    raw.decode_content = True
+    try:
+        while (chunk := raw.read1(DOWNLOAD_CHUNK_SIZE)):
+            yield chunk
+    finally:
+        response.close()
+
 @app.route('/api/media/gopro/<gopro_id>/files/<directory>/<filename>/download', methods=['GET'])
 def download_gopro_file(gopro_id, directory, filename):
     """Proxy download of a file from GoPro"""
@@ -3522,43 +3965,65 @@ def download_gopro_file(gopro_id, directory, filename):
 
     try:
         download_url = f'http://{gopro_ip}:8080/videos/DCIM/{directory}/{filename}'
-        response = requests.get(download_url, stream=True, timeout=300)
-
-        def generate():
-            for chunk in response.iter_content(chunk_size=65536):
-                yield chunk
+        response = _gopro_session.get(download_url, stream=True, timeout=300)
 
         return Response(
-            generate(),
+            _proxy_gopro_body(response),
             headers={
                 'Content-Type': 'video/mp4',
                 'Content-Disposition': f'attachment; filename="{filename}"',
                 'Content-Length': response.headers.get('Content-Length', '')
             }
         )
+    except requests.ConnectionError as e:
+        # The camera dropped off or changed IP; don't keep trusting the
+        # cached address for the rest of GOPRO_IP_VERIFIED_TTL
+        _forget_gopro_ip_verification(gopro_id)
+        return jsonify({'success': False, 'error': str(e)}), 500
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
 @app.route('/api/media/gopro/<gopro_id>/files/<directory>/<filename>/thumbnail', methods=['GET'])
 def get_gopro_thumbnail(gopro_id, directory, filename):
     """Get thumbnail for a GoPro file"""
-    gopro_ip = get_gopro_wired_ip(gopro_id)
-    if not gopro_ip:
-        return jsonify({'success': False, 'error': 'GoPro not found or not connected'}), 404
+    cache_key = (gopro_id, directory, filename)
+    with _gopro_thumbnail_cache_lock:
+        cached = _gopro_thumbnail_cache.get(cache_key)
+        stamp = _gopro_media_stamps.get(gopro_id, {}).get((directory, filename))
 
-    try:
-        thumb_url = f'http://{gopro_ip}:8080/gopro/media/thumbnail?path={directory}/{filename}'
-        response = requests.get(thumb_url, timeout=10)
+    if cached and cached[1] == stamp and time.monotonic() - cached[0] < GOPRO_THUMBNAIL_CACHE_TTL:
+        thumbnail = cached[2]
+    else:
+        gopro_ip = get_gopro_wired_ip(gopro_id)
+        if not gopro_ip:
+            return jsonify({'success': False, 'error': 'GoPro not found or not connected'}), 404
 
-        return Response(
-            response.content,
-            headers={
-                'Content-Type': 'image/jpeg',
-                'Cache-Control': 'max-age=3600'
-            }
-        )
-    except Exception as e:
-        return jsonify({'success': False, 'error': str(e)}), 500
+        try:
+            thumb_url = f'http://{gopro_ip}:8080/gopro/media/thumbnail?path={directory}/{filename}'
+            response = _gopro_session.get(thumb_url, timeout=10)
+        except requests.ConnectionError as e:
+            # The camera dropped off or changed IP; don't keep trusting the
+            # cached address for the rest of GOPRO_IP_VERIFIED_TTL
+            _forget_gopro_ip_verification(gopro_id)
+            return jsonify({'success': False, 'error': str(e)}), 500
+        except Exception as e:
+            return jsonify({'success': False, 'error': str(e)}), 500
+
+        thumbnail = response.content
+        if response.status_code == 200:
+            with _gopro_thumbnail_cache_lock:
+                _gopro_thumbnail_cache.pop(cache_key, None)
+                if len(_gopro_thumbnail_cache) >= GOPRO_THUMBNAIL_CACHE_MAX:
+                    del _gopro_thumbnail_cache[next(iter(_gopro_thumbnail_cache))]
+                _gopro_thumbnail_cache[cache_key] = (time.monotonic(), stamp, thumbnail)
+
+    return Response(
+        thumbnail,
+        headers={
+            'Content-Type': 'image/jpeg',
+            'Cache-Control': 'max-age=3600'
+        }
+    )
 
 @app.route('/api/media/gopro/<gopro_id>/files/<directory>/<filename>/stream', methods=['GET'])
 def stream_gopro_file(gopro_id, directory, filename):
@@ -3576,11 +4041,7 @@ def stream_gopro_file(gopro_id, directory, filename):
         if range_header:
             headers['Range'] = range_header
 
-        response = requests.get(stream_url, headers=headers, stream=True, timeout=30)
-
-        def generate():
-            for chunk in response.iter_content(chunk_size=65536):
-                yield chunk
+        response = _gopro_session.get(stream_url, headers=headers, stream=True, timeout=30)
 
         resp_headers = {
             'Content-Type': 'video/mp4',
@@ -3593,10 +4054,15 @@ def stream_gopro_file(gopro_id, directory, filename):
             resp_headers['Content-Length'] = response.headers['Content-Length']
 
         return Response(
-            generate(),
+            _proxy_gopro_body(response),
             status=response.status_code,
             headers=resp_headers
         )
+    except requests.ConnectionError as e:
+        # The camera dropped off or changed IP; don't keep trusting the
+        # cached address for the rest of GOPRO_IP_VERIFIED_TTL
+        _forget_gopro_ip_verification(gopro_id)
+        return jsonify({'success': False, 'error': str(e)}), 500
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
 
@@ -3681,45 +4147,15 @@ def stream_segment_file(session_name, filename):
                 'error': 'Segment file not found'
             }), 404
 
-        file_size = os.path.getsize(file_path)
-        range_header = request.headers.get('Range')
-
-        if range_header:
-            byte_start = 0
-            byte_end = file_size - 1
-
-            range_match = range_header.replace('bytes=', '').split('-')
-            if range_match[0]:
-                byte_start = int(range_match[0])
-            if range_match[1]:
-                byte_end = int(range_match[1])
-
-            length = byte_end - byte_start + 1
-
-            def generate():
-                with open(file_path, 'rb') as f:
-                    f.seek(byte_start)
-                    remaining = length
-                    while remaining > 0:
-                        chunk_size = min(8192, remaining)
-                        data = f.read(chunk_size)
-                        if not data:
-                            break
-                        remaining -= len(data)
-                        yield data
-
-            response = Response(
-                generate(),
-                status=206,
-                mimetype='video/mp4',
-                direct_passthrough=True
-            )
-            response.headers['Content-Range'] = f'bytes {byte_start}-{byte_end}/{file_size}'
-            response.headers['Accept-Ranges'] = 'bytes'
-            response.headers['Content-Length'] = length
-            return response
-
-        return send_file(file_path, mimetype='video/mp4')
+        # Same as stream_video: send_file answers Range/If-Range itself and
+        # serves the range through wsgi.file_wrapper (sendfile(2) where the
+        # server supports it) instead of a Python read/yield loop
+        return send_file(
+            file_path,
+            mimetype='video/mp4',
+            conditional=True,
+            etag=True
+        )
 
     except Exception as e:
         return jsonify({
@@ -3733,6 +4169,15 @@ def stream_segment_file(session_name, filename):
 segment_upload_status = {}
 segment_upload_lock = threading.Lock()
 
+# Segment uploads share one worker rather than a thread per request:
+# videoupload keeps S3 transfers single-threaded (concurrent transfers hit
+# SSL EOF errors on the Jetson), so sessions queue here in request order
+_segment_upload_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='segup')
+
+# Segment session folder name: interfaceId_YYYYMMDD_HHMMSS. The interface ID
+# may itself contain underscores, so split on the last two only.
+_SEGMENT_SESSION_NAME_RE = re.compile(r'^(.*)_([^_]*)_([^_]*)$')
+
 @app.route('/api/media/segments/upload', methods=['POST'])
 def upload_segments_to_cloud():
     """
@@ -3790,61 +4235,50 @@ def upload_segments_to_cloud():
         # Generate upload ID
         upload_id = f"upload_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
 
-        # Start upload in background thread
-        def upload_sessions_background():
-            results = []
-            total_sessions = len(sessions_to_upload)
+        with segment_upload_lock:
+            segment_upload_status[upload_id] = {
+                'status': 'in_progress',
+                'total': len(sessions_to_upload),
+                'completed': 0,
+                'current_session': None,
+                'results': [],
+                'errors': []
+            }
 
+        def upload_session(idx, session):
             with segment_upload_lock:
-                segment_upload_status[upload_id] = {
-                    'status': 'in_progress',
-                    'total': total_sessions,
-                    'completed': 0,
-                    'current_session': None,
-                    'results': [],
-                    'errors': []
-                }
-
-            for idx, session in enumerate(sessions_to_upload):
-                session_name = session['session_name']
-
-                with segment_upload_lock:
-                    segment_upload_status[upload_id]['current_session'] = session_name
-                    segment_upload_status[upload_id]['current_index'] = idx + 1
+                status = segment_upload_status[upload_id]
+                status['current_session'] = session['session_name']
+                status['current_index'] = idx + 1
+            return upload_single_segment_session(
+                session,
+                camera_name_map,
+                delete_after_upload,
+                compress
+            )
 
-                try:
-                    result = upload_single_segment_session(
-                        session,
-                        camera_name_map,
-                        delete_after_upload,
-                        compress
-                    )
-                    results.append(result)
-
-                    with segment_upload_lock:
-                        segment_upload_status[upload_id]['completed'] = idx + 1
-                        segment_upload_status[upload_id]['results'].append(result)
-
-                except Exception as e:
-                    error_result = {
+        def record_result(session_name, future):
+            error = future.exception()
+            with segment_upload_lock:
+                status = segment_upload_status[upload_id]
+                status['completed'] += 1
+                if error is None:
+                    status['results'].append(future.result())
+                else:
+                    status['errors'].append({
                         'session_name': session_name,
                         'success': False,
-                        'error': str(e)
-                    }
-                    results.append(error_result)
-
-                    with segment_upload_lock:
-                        segment_upload_status[upload_id]['completed'] = idx + 1
-                        segment_upload_status[upload_id]['errors'].append(error_result)
-
-            with segment_upload_lock:
-                segment_upload_status[upload_id]['status'] = 'completed'
-                segment_upload_status[upload_id]['current_session'] = None
+                        'error': str(error)
+                    })
+                if status['completed'] == status['total']:
+                    status['status'] = 'completed'
+                    status['current_session'] = None
 
-        # Start background thread
-        upload_thread = threading.Thread(target=upload_sessions_background)
-        upload_thread.daemon = True
-        upload_thread.start()
+        # One future per session on the shared upload worker
+        for idx, session in enumerate(sessions_to_upload):
+            future = _segment_upload_pool.submit(upload_session, idx, session)
+            future.add_done_callback(
+                lambda f, name=session['session_name']: record_result(name, f))
 
         return jsonify({
             'success': True,
@@ -3879,17 +4313,15 @@ def upload_single_segment_session(session: dict, camera_name_map: dict, delete_a
     logger.info(f"[SegmentUpload] Processing session: {session_name}")
 
     # Parse session name: format is interfaceId_YYYYMMDD_HHMMSS
-    parts = session_name.split('_')
-    if len(parts) < 3:
+    match = _SEGMENT_SESSION_NAME_RE.match(session_name)
+    if not match:
         return {
             'session_name': session_name,
             'success': False,
             'error': f'Invalid session name format: {session_name}'
         }
 
-    interface_id = '_'.join(parts[:-2])  # Everything except last 2 parts
-    date_str = parts[-2]  # YYYYMMDD
-    time_str = parts[-1]  # HHMMSS
+    interface_id, date_str, time_str = match.groups()
 
     # Format date for S3: YYYY-MM-DD
     upload_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
@@ -4145,16 +4577,15 @@ def upload_single_segment_session_with_progress(session: dict, camera_name_map:
     logger.info(f"[SegmentUpload] Processing session: {session_name}")
 
     # Parse session name: format is interfaceId_YYYYMMDD_HHMMSS
-    parts = session_name.split('_')
-    if len(parts) < 3:
+    match = _SEGMENT_SESSION_NAME_RE.match(session_name)
+    if not match:
         return {
             'session_name': session_name,
             'success': False,
             'error': f'Invalid session name format: {session_name}'
         }
 
-    interface_id = '_'.join(parts[:-2])
-    date_str = parts[-2]
+    interface_id, date_str, _ = match.groups()
     upload_date = f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:8]}"
 
     camera_name = camera_name_map.get(interface_id)
@@ -4622,9 +5053,7 @@ def complete_batch_transcode(job_id):
         return jsonify(result)
 
     except Exception as e:
-        logger.error(f"[BatchTranscode] Error completing job: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[BatchTranscode] Error completing job: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -4775,25 +5204,37 @@ def _run_admin_job(job_id, device_id, operation, params):
             with admin_jobs_lock:
                 admin_jobs[job_id]['pid'] = proc.pid
 
-            # Read stdout and stderr concurrently using selectors
+            # Read stdout and stderr concurrently using selectors. A self-pipe
+            # is registered alongside them so cancel_admin_job can wake the
+            # loop immediately instead of it polling the job status.
+            wake_r, wake_w = os.pipe()
+            with admin_jobs_lock:
+                admin_jobs[job_id]['wake_fd'] = wake_w
+
             sel = selectors.DefaultSelector()
             sel.register(proc.stdout, selectors.EVENT_READ)
             sel.register(proc.stderr, selectors.EVENT_READ)
+            sel.register(wake_r, selectors.EVENT_READ)
 
             open_streams = 2
-            while open_streams > 0:
-                # Check if job was cancelled
-                with admin_jobs_lock:
-                    if admin_jobs[job_id]['status'] == 'cancelled':
-                        proc.terminate()
-                        break
-
-                events = sel.select(timeout=0.5)
+            cancelled = False
+            while open_streams > 0 and not cancelled:
+                events = sel.select()
                 for key, _ in events:
+                    if key.fileobj == wake_r:
+                        # Check if job was cancelled
+                        os.read(wake_r, 64)
+                        with admin_jobs_lock:
+                            cancelled = admin_jobs[job_id]['status'] == 'cancelled'
+                        if cancelled:
+                            proc.terminate()
+                            break
+                        continue
+
                     line = key.fileobj.readline()
                     if line:
                         stream = 'stdout' if key.fileobj == proc.stdout else 'stderr'
-                        cleaned = _ansi_re.sub('', line.rstrip('\n'))
+                        cleaned = _strip_ansi(line.rstrip('\n'))
                         if cleaned:  # skip empty lines after stripping
                             entry = {
                                 'ts': datetime.now().isoformat(),
@@ -4807,6 +5248,10 @@ def _run_admin_job(job_id, device_id, operation, params):
                         open_streams -= 1
 
             sel.close()
+            with admin_jobs_lock:
+                admin_jobs[job_id].pop('wake_fd', None)
+            os.close(wake_w)
+            os.close(wake_r)
             proc.wait(timeout=10)
 
             with admin_jobs_lock:
@@ -4948,7 +5393,7 @@ def stream_admin_job(job_id):
         return jsonify({'success': False, 'error': 'Job not found'}), 404
 
     def generate():
-        yield f"data: {json.dumps({'type': 'connected', 'job_id': job_id})}\n\n"
+        yield f"data: {app.json.dumps({'type': 'connected', 'job_id': job_id})}\n\n"
 
         cursor = 0
 
@@ -4962,13 +5407,13 @@ def stream_admin_job(job_id):
                 status = current_job['status']
 
             for line in new_lines:
-                yield f"data: {json.dumps({'type': 'output', **line})}\n\n"
+                yield f"data: {app.json.dumps({'type': 'output', **line})}\n\n"
                 cursor += 1
 
             if status in ('completed', 'failed', 'cancelled'):
                 with admin_jobs_lock:
                     final = admin_jobs[job_id]
-                yield f"data: {json.dumps({'type': 'done', 'status': final['status'], 'exit_code': final.get('exit_code'), 'error': final.get('error')})}\n\n"
+                yield f"data: {app.json.dumps({'type': 'done', 'status': final['status'], 'exit_code': final.get('exit_code'), 'error': final.get('error')})}\n\n"
                 break
 
             time.sleep(0.2)
@@ -4999,6 +5444,13 @@ def cancel_admin_job(job_id):
     pid = job.get('pid')
     with admin_jobs_lock:
         admin_jobs[job_id]['status'] = 'cancelled'
+        wake_fd = admin_jobs[job_id].get('wake_fd')
+        if wake_fd is not None:
+            # Wake the job's output loop so it terminates the process now
+            try:
+                os.write(wake_fd, b'x')
+            except OSError:
+                pass
 
     if pid:
         try:
@@ -5085,9 +5537,7 @@ def recover_session(session_id):
         })
 
     except Exception as e:
-        logger.error(f"[Recover] Error recovering session {session_id}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[Recover] Error recovering session {session_id}: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
@@ -5343,9 +5793,7 @@ def upload_session_chapters(session_id):
                         pipeline_jobs[job_id]['completed_at'] = datetime.now().isoformat()
 
             except Exception as e:
-                logger.error(f"[Pipeline] Upload job {job_id} failed: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.exception(f"[Pipeline] Upload job {job_id} failed: {e}")
                 with pipeline_jobs_lock:
                     pipeline_jobs[job_id]['status'] = 'failed'
                     pipeline_jobs[job_id]['substage'] = 'failed'
@@ -5364,9 +5812,7 @@ def upload_session_chapters(session_id):
         })
 
     except Exception as e:
-        logger.error(f"[Pipeline] Error starting chapter upload: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[Pipeline] Error starting chapter upload: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -5448,7 +5894,6 @@ def list_pipeline_jobs():
 # ==================== Full Pipeline Automation ====================
 
 # Initialize pipeline orchestrator
-from pipeline_orchestrator import init_orchestrator, get_orchestrator
 
 pipeline_orchestrator = None
 if firebase_service and upload_service:
@@ -5563,9 +6008,7 @@ def start_auto_pipeline():
         })
 
     except Exception as e:
-        logger.error(f"[Pipeline] Error starting auto pipeline: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.exception(f"[Pipeline] Error starting auto pipeline: {e}")
         return jsonify({
             'success': False,
             'error': str(e)
@@ -5620,7 +6063,6 @@ def get_full_pipeline_status(pipeline_id):
 @app.route('/api/pipeline/full/<pipeline_id>/cancel', methods=['POST'])
 def cancel_pipeline(pipeline_id):
     """Cancel a running pipeline."""
-    from pipeline_orchestrator import get_orchestrator
     orchestrator = get_orchestrator()
     if not orchestrator:
         return jsonify({'success': False, 'error': 'Pipeline orchestrator not initialized'}), 500
@@ -5659,22 +6101,12 @@ def list_full_pipelines():
     })
 
 
-if __name__ == '__main__':
-    logger.info("=" * 60)
-    logger.info("GoPro Controller API Service Starting...")
-    logger.info("=" * 60)
-    logger.info(f"Video storage: {VIDEO_STORAGE_DIR}")
-    logger.info(f"Segments storage: {SEGMENTS_DIR}")
-    logger.info(f"Log directory: {logging_service.log_dir}")
-    logger.info(f"API endpoint: http://0.0.0.0:5000")
-    logger.info("Make sure GoPros are connected via USB")
-
-    logger.info("AWS Batch Transcoding: ENABLED")
-    logger.info(f"  Job Queue: {os.getenv('AWS_BATCH_JOB_QUEUE', 'gpu-transcode-queue')}")
-    logger.info(f"  Job Definition: {os.getenv('AWS_BATCH_JOB_DEFINITION', 'ffmpeg-nvenc-transcode')}")
-
-    logger.info("=" * 60)
+def run_startup_tasks():
+    """One-time Firebase cleanup/recovery run when the server starts.
 
+    Called from __main__ for the built-in server and from gunicorn.conf.py's
+    post_worker_init hook when running under gunicorn.
+    """
     # Cleanup any pipelines that were left in 'running' state by a previous crash/restart
     if firebase_service:
         stale_count = firebase_service.cleanup_stale_running_pipelines()
@@ -5691,4 +6123,23 @@ if __name__ == '__main__':
         if migrated_count:
             logger.info(f"Startup migration: updated {migrated_count} legacy session(s) to 'uploaded'")
 
+
+if __name__ == '__main__':
+    logger.info("=" * 60)
+    logger.info("GoPro Controller API Service Starting...")
+    logger.info("=" * 60)
+    logger.info(f"Video storage: {VIDEO_STORAGE_DIR}")
+    logger.info(f"Segments storage: {SEGMENTS_DIR}")
+    logger.info(f"Log directory: {logging_service.log_dir}")
+    logger.info(f"API endpoint: http://0.0.0.0:5000")
+    logger.info("Make sure GoPros are connected via USB")
+
+    logger.info("AWS Batch Transcoding: ENABLED")
+    logger.info(f"  Job Queue: {os.getenv('AWS_BATCH_JOB_QUEUE', 'gpu-transcode-queue')}")
+    logger.info(f"  Job Definition: {os.getenv('AWS_BATCH_JOB_DEFINITION', 'ffmpeg-nvenc-transcode')}")
+
+    logger.info("=" * 60)
+
+    run_startup_tasks()
+
     app.run(host='0.0.0.0', port=5000, debug=False, threaded=True)
@@ -5,11 +5,17 @@ from both GoPro cameras and the Jetson local storage.
 """
 
 import os
+import threading
+import time
 import requests
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
+# get_local_media_list() result is reused until the storage directory changes
+# (file added/removed/renamed) or this many seconds pass, so the size of a
+# file that is still being written does not go stale for long.
+LOCAL_MEDIA_CACHE_TTL = 5  # seconds
 
 class MediaService:
     """
@@ -27,6 +33,8 @@ class MediaService:
         self.segments_dir = os.path.join(self.local_storage_dir, 'segments')
         os.makedirs(self.local_storage_dir, exist_ok=True)
         os.makedirs(self.segments_dir, exist_ok=True)
+        self._local_media_cache = {'key': None, 'ts': 0.0, 'result': None}
+        self._local_media_cache_lock = threading.Lock()
 
     # ==================== GoPro Media Management ====================
 
@@ -252,9 +260,32 @@ class MediaService:
         """
         Get list of all videos in local Jetson storage.
 
+        Cached per storage-directory mtime, see LOCAL_MEDIA_CACHE_TTL.
+
         Returns:
             Dict with media list
         """
+        try:
+            key = os.stat(self.local_storage_dir).st_mtime_ns
+        except OSError:
+            key = None
+        now = time.monotonic()
+        cache = self._local_media_cache
+        with self._local_media_cache_lock:
+            if (key is not None and cache['key'] == key
+                    and now - cache['ts'] < LOCAL_MEDIA_CACHE_TTL):
+                return cache['result']
+
+        result = self._scan_local_media()
+        if result['success']:
+            with self._local_media_cache_lock:
+                cache['key'] = key
+                cache['ts'] = now
+                cache['result'] = result
+        return result
+
+    def _scan_local_media(self) -> Dict[str, Any]:
+        """Scan local storage for videos (uncached get_local_media_list)."""
         try:
             video_path = Path(self.local_storage_dir)
             files = []
@@ -14,6 +14,7 @@ The pipeline is triggered automatically after recording stops.
 import os
 import threading
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Any, Optional, Callable
 from enum import Enum
@@ -388,156 +389,47 @@ class PipelineOrchestrator:
             'progress': 5
         })
 
-        from chapter_upload_service import ChapterUploadService
-        chapter_service = ChapterUploadService(
-            s3_client=self.upload_service.s3_client,
-            bucket_name=self.upload_service.bucket_name
-        )
+        from chapter_upload_service import ChapterUploadService, SerializedS3Client
 
         upload_errors = []
 
-        for i, session in enumerate(sessions):
-            if self._is_cancelled(pipeline_id):
-                self._mark_cancelled(pipeline_id)
-                return
-
-            session_id = session['id']
-            interface_id = session.get('interfaceId', '')
-            existing_s3_prefix = session.get('s3Prefix')
-
-            # Skip upload if session already has chapters in S3
-            if existing_s3_prefix:
-                logger.info(f"[Pipeline {pipeline_id}] Session {session_id} already uploaded to {existing_s3_prefix}, skipping upload")
-                # Fix session status in Firebase so it won't be re-picked up next pipeline run
-                if session.get('status') == 'stopped':
-                    self.firebase_service.update_session_s3_prefix(session_id, existing_s3_prefix)
-                    logger.info(f"[Pipeline {pipeline_id}] Fixed session {session_id} status: stopped -> uploaded")
-                self._update_session_state(pipeline_id, session_id, {
-                    'status': 'completed',
-                    's3_prefix': existing_s3_prefix,
-                    'chapters_uploaded': session.get('totalChapters', 0),
-                    'skipped': True
-                })
-                with self._lock:
-                    count = self._pipelines[pipeline_id]['sessions_uploaded'] + 1
-                    self._pipelines[pipeline_id]['sessions_uploaded'] = count
-                # Firebase: update session upload count
-                self._firebase_update_pipeline(pipeline_id, {
-                    'sessions_uploaded': count,
-                    'stage_message': f'Uploading chapters ({count}/{len(sessions)})...'
-                })
-                continue
-
-            gopro_ip = gopro_connections.get(interface_id)
-
-            if not gopro_ip:
-                error = f"No GoPro IP for interface {interface_id}"
-                upload_errors.append(error)
-                self._update_session_state(pipeline_id, session_id, {
-                    'status': 'failed',
-                    'error': error
-                })
-                continue
-
-            self._update_session_state(pipeline_id, session_id, {
-                'status': 'uploading'
-            })
-
-            self._update_pipeline(pipeline_id, {
-                'stage_message': f'Uploading {_normalize_angle_code(session.get("angleCode"))} ({i+1}/{len(sessions)})...'
-            })
-
-            try:
-                # Get chapters for this session
-                stored_chapters = session.get('chapterFiles')
-                if stored_chapters:
-                    # Preferred: use exact filenames stored during recording stop
-                    chapters_to_upload = stored_chapters
-                    logger.info(f"[Pipeline {pipeline_id}] Session {session_id} using {len(chapters_to_upload)} stored chapter filenames")
-                else:
-                    # Legacy fallback: session was created before chapterFiles was stored.
-                    # Take last N chapters from GoPro, but ONLY if totalChapters > 0.
-                    expected_count = session.get('totalChapters', 0)
-                    if expected_count == 0:
-                        error = f"Session has no chapterFiles and totalChapters=0 — cannot determine which files to upload"
-                        logger.warning(f"[Pipeline {pipeline_id}] Session {session_id}: {error}")
-                        upload_errors.append(f"{_normalize_angle_code(session.get('angleCode'))}: {error}")
-                        self._update_session_state(pipeline_id, session_id, {
-                            'status': 'failed',
-                            'error': error
-                        })
-                        continue
-                    all_chapters = chapter_service.get_gopro_media_list(gopro_ip)
-                    chapters_to_upload = all_chapters[-expected_count:]
-                    logger.warning(f"[Pipeline {pipeline_id}] Session {session_id} using legacy last-{expected_count} fallback (no chapterFiles stored)")
-
-                self._update_session_state(pipeline_id, session_id, {
-                    'chapters_total': len(chapters_to_upload)
-                })
-
-                # Progress callback for this session
-                def session_progress(stage, chapter_num, total, bytes_uploaded):
-                    self._update_session_state(pipeline_id, session_id, {
-                        'chapters_uploaded': chapter_num if stage != 'streaming' else chapter_num - 1,
-                        'bytes_uploaded': bytes_uploaded
-                    })
-                    # Update overall progress
-                    base_progress = 5 + int((i / len(sessions)) * 30)
-                    session_progress_pct = (chapter_num / total) * 30 / len(sessions) if total > 0 else 0
-                    self._update_pipeline(pipeline_id, {
-                        'progress': int(base_progress + session_progress_pct)
-                    })
-
-                # Upload chapters
-                result = chapter_service.upload_session_chapters(
-                    session=session,
-                    gopro_ip=gopro_ip,
-                    chapters=chapters_to_upload,
-                    progress_callback=session_progress,
-                    cancel_fn=lambda: self._is_cancelled(pipeline_id)
-                )
-
-                if result.get('cancelled'):
-                    self._mark_cancelled(pipeline_id)
+        # Sessions from different cameras come over independent USB links, so
+        # read them concurrently with one worker per camera interface.
+        # Sessions recorded on the same camera stay sequential so they don't
+        # split that camera's bandwidth. The S3 side is still serialized: the
+        # upload client is single-connection to avoid SSL EOF errors on ARM,
+        # so the workers share it through one lock.
+        s3_client = SerializedS3Client(self.upload_service.s3_client)
+        sessions_by_interface: Dict[str, List[Dict[str, Any]]] = {}
+        for session in sessions:
+            sessions_by_interface.setdefault(session.get('interfaceId', ''), []).append(session)
+        # session id -> fraction of its upload done (0..1); overall progress
+        # and the stage message are derived from all of them, under self._lock
+        upload_fractions: Dict[str, float] = {}
+
+        def upload_camera_sessions(camera_sessions):
+            # One service per worker: it keeps per-upload keep-alive state
+            chapter_service = ChapterUploadService(
+                s3_client=s3_client,
+                bucket_name=self.upload_service.bucket_name
+            )
+            for session in camera_sessions:
+                if self._is_cancelled(pipeline_id):
+                    return
+                if not self._upload_pipeline_session(
+                    pipeline_id, session, sessions, upload_fractions,
+                    gopro_connections, chapter_service, upload_errors
+                ):
                     return
 
-                if result['success']:
-                    # Update Firebase with s3Prefix
-                    self.firebase_service.update_session_s3_prefix(session_id, result['s3_prefix'])
-
-                    self._update_session_state(pipeline_id, session_id, {
-                        'status': 'completed',
-                        's3_prefix': result['s3_prefix'],
-                        'chapters_uploaded': result['chapters_uploaded'],
-                        'bytes_uploaded': result['total_bytes']
-                    })
-
-                    with self._lock:
-                        count = self._pipelines[pipeline_id]['sessions_uploaded'] + 1
-                        self._pipelines[pipeline_id]['sessions_uploaded'] = count
-                    # Firebase: update session upload count
-                    self._firebase_update_pipeline(pipeline_id, {
-                        'sessions_uploaded': count,
-                        'stage_message': f'Uploading chapters ({count}/{len(sessions)})...'
-                    })
-
-                    logger.info(f"[Pipeline {pipeline_id}] Session {session_id} uploaded to {result['s3_prefix']}")
-                else:
-                    error = '; '.join(result.get('errors', ['Unknown error']))
-                    upload_errors.append(f"{_normalize_angle_code(session.get('angleCode'))}: {error}")
-                    self._update_session_state(pipeline_id, session_id, {
-                        'status': 'failed',
-                        'error': error
-                    })
-
-            except Exception as e:
-                error = str(e)
-                upload_errors.append(f"{_normalize_angle_code(session.get('angleCode'))}: {error}")
-                self._update_session_state(pipeline_id, session_id, {
-                    'status': 'failed',
-                    'error': error
-                })
-                logger.error(f"[Pipeline {pipeline_id}] Session {session_id} upload failed: {e}")
+        with ThreadPoolExecutor(
+            max_workers=max(1, len(sessions_by_interface)),
+            thread_name_prefix='chapter-upload'
+        ) as executor:
+            futures = [executor.submit(upload_camera_sessions, camera_sessions)
+                       for camera_sessions in sessions_by_interface.values()]
+            for future in futures:
+                future.result()
 
         if upload_errors:
             with self._lock:
@@ -1063,6 +955,178 @@ class PipelineOrchestrator:
             'games_failed': games_failed,
         })
 
+    def _set_upload_fraction(
+        self,
+        pipeline_id: str,
+        upload_fractions: Dict[str, float],
+        session_id: str,
+        fraction: float,
+        total_sessions: int
+    ):
+        """Record one session's upload fraction and refresh overall progress.
+
+        Sessions upload concurrently (one worker per camera), so progress is
+        the sum over all sessions rather than any one session's position.
+        Fractions only move forward, and the pipeline is updated under the
+        same lock, so the progress bar never goes backwards.
+        """
+        with self._lock:
+            upload_fractions[session_id] = max(fraction, upload_fractions.get(session_id, 0.0))
+            finished = sum(1 for f in upload_fractions.values() if f >= 1.0)
+            uploading = len(upload_fractions) - finished
+            self._update_pipeline(pipeline_id, {
+                'progress': 5 + int(sum(upload_fractions.values()) / total_sessions * 30),
+                'stage_message': f'Uploading chapters: {uploading} of {total_sessions} sessions uploading, {finished} finished...'
+            })
+
+    def _upload_pipeline_session(
+        self,
+        pipeline_id: str,
+        session: Dict[str, Any],
+        sessions: List[Dict[str, Any]],
+        upload_fractions: Dict[str, float],
+        gopro_connections: Dict[str, str],
+        chapter_service,
+        upload_errors: List[str]
+    ) -> bool:
+        """Upload one session's chapters (phase 1). Returns False if cancelled."""
+        session_id = session['id']
+        interface_id = session.get('interfaceId', '')
+        existing_s3_prefix = session.get('s3Prefix')
+
+        # Skip upload if session already has chapters in S3
+        if existing_s3_prefix:
+            logger.info(f"[Pipeline {pipeline_id}] Session {session_id} already uploaded to {existing_s3_prefix}, skipping upload")
+            # Fix session status in Firebase so it won't be re-picked up next pipeline run
+            if session.get('status') == 'stopped':
+                self.firebase_service.update_session_s3_prefix(session_id, existing_s3_prefix)
+                logger.info(f"[Pipeline {pipeline_id}] Fixed session {session_id} status: stopped -> uploaded")
+            self._update_session_state(pipeline_id, session_id, {
+                'status': 'completed',
+                's3_prefix': existing_s3_prefix,
+                'chapters_uploaded': session.get('totalChapters', 0),
+                'skipped': True
+            })
+            self._set_upload_fraction(pipeline_id, upload_fractions, session_id, 1.0, len(sessions))
+            with self._lock:
+                count = self._pipelines[pipeline_id]['sessions_uploaded'] + 1
+                self._pipelines[pipeline_id]['sessions_uploaded'] = count
+            # Firebase: update session upload count
+            self._firebase_update_pipeline(pipeline_id, {
+                'sessions_uploaded': count,
+                'stage_message': f'Uploading chapters ({count}/{len(sessions)})...'
+            })
+            return True
+
+        gopro_ip = gopro_connections.get(interface_id)
+
+        if not gopro_ip:
+            error = f"No GoPro IP for interface {interface_id}"
+            upload_errors.append(error)
+            self._update_session_state(pipeline_id, session_id, {
+                'status': 'failed',
+                'error': error
+            })
+            self._set_upload_fraction(pipeline_id, upload_fractions, session_id, 1.0, len(sessions))
+            return True
+
+        self._update_session_state(pipeline_id, session_id, {
+            'status': 'uploading'
+        })
+        self._set_upload_fraction(pipeline_id, upload_fractions, session_id, 0.0, len(sessions))
+
+        try:
+            # Get chapters for this session
+            stored_chapters = session.get('chapterFiles')
+            if stored_chapters:
+                # Preferred: use exact filenames stored during recording stop
+                chapters_to_upload = stored_chapters
+                logger.info(f"[Pipeline {pipeline_id}] Session {session_id} using {len(chapters_to_upload)} stored chapter filenames")
+            else:
+                # Legacy fallback: session was created before chapterFiles was stored.
+                # Take last N chapters from GoPro, but ONLY if totalChapters > 0.
+                expected_count = session.get('totalChapters', 0)
+                if expected_count == 0:
+                    error = f"Session has no chapterFiles and totalChapters=0 — cannot determine which files to upload"
+                    logger.warning(f"[Pipeline {pipeline_id}] Session {session_id}: {error}")
+                    upload_errors.append(f"{_normalize_angle_code(session.get('angleCode'))}: {error}")
+                    self._update_session_state(pipeline_id, session_id, {
+                        'status': 'failed',
+                        'error': error
+                    })
+                    self._set_upload_fraction(pipeline_id, upload_fractions, session_id, 1.0, len(sessions))
+                    return True
+                all_chapters = chapter_service.get_gopro_media_list(gopro_ip)
+                chapters_to_upload = all_chapters[-expected_count:]
+                logger.warning(f"[Pipeline {pipeline_id}] Session {session_id} using legacy last-{expected_count} fallback (no chapterFiles stored)")
+
+            self._update_session_state(pipeline_id, session_id, {
+                'chapters_total': len(chapters_to_upload)
+            })
+
+            # Progress callback for this session
+            def session_progress(stage, chapter_num, total, bytes_uploaded):
+                self._update_session_state(pipeline_id, session_id, {
+                    'chapters_uploaded': chapter_num if stage != 'streaming' else chapter_num - 1,
+                    'bytes_uploaded': bytes_uploaded
+                })
+                if total > 0:
+                    self._set_upload_fraction(
+                        pipeline_id, upload_fractions, session_id, chapter_num / total, len(sessions))
+
+            # Upload chapters
+            result = chapter_service.upload_session_chapters(
+                session=session,
+                gopro_ip=gopro_ip,
+                chapters=chapters_to_upload,
+                progress_callback=session_progress,
+                cancel_fn=lambda: self._is_cancelled(pipeline_id)
+            )
+
+            if result.get('cancelled'):
+                return False
+
+            if result['success']:
+                # Update Firebase with s3Prefix
+                self.firebase_service.update_session_s3_prefix(session_id, result['s3_prefix'])
+
+                self._update_session_state(pipeline_id, session_id, {
+                    'status': 'completed',
+                    's3_prefix': result['s3_prefix'],
+                    'chapters_uploaded': result['chapters_uploaded'],
+                    'bytes_uploaded': result['total_bytes']
+                })
+
+                with self._lock:
+                    count = self._pipelines[pipeline_id]['sessions_uploaded'] + 1
+                    self._pipelines[pipeline_id]['sessions_uploaded'] = count
+                # Firebase: update session upload count
+                self._firebase_update_pipeline(pipeline_id, {
+                    'sessions_uploaded': count,
+                    'stage_message': f'Uploading chapters ({count}/{len(sessions)})...'
+                })
+
+                logger.info(f"[Pipeline {pipeline_id}] Session {session_id} uploaded to {result['s3_prefix']}")
+            else:
+                error = '; '.join(result.get('errors', ['Unknown error']))
+                upload_errors.append(f"{_normalize_angle_code(session.get('angleCode'))}: {error}")
+                self._update_session_state(pipeline_id, session_id, {
+                    'status': 'failed',
+                    'error': error
+                })
+
+        except Exception as e:
+            error = str(e)
+            upload_errors.append(f"{_normalize_angle_code(session.get('angleCode'))}: {error}")
+            self._update_session_state(pipeline_id, session_id, {
+                'status': 'failed',
+                'error': error
+            })
+            logger.error(f"[Pipeline {pipeline_id}] Session {session_id} upload failed: {e}")
+
+        self._set_upload_fraction(pipeline_id, upload_fractions, session_id, 1.0, len(sessions))
+        return True
+
     def _firebase_update_pipeline(self, pipeline_id: str, updates: Dict[str, Any]):
         """Write pipeline updates to Firebase. Failures are logged but don't crash the pipeline."""
         try:
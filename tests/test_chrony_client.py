@@ -0,0 +1,111 @@
+"""Tests for ``chrony_client``.
+
+``/api/system/ntp`` reads chronyd's tracking state over its command socket
+and falls back to parsing ``chronyc tracking``; both paths must produce the
+same fields.
+"""
+
+from __future__ import annotations
+
+import socket
+import struct
+import sys
+import threading
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+import chrony_client  # noqa: E402
+from chrony_client import (  # noqa: E402
+    _decode_float, parse_tracking_output, parse_tracking_reply, query_tracking,
+)
+
+CHRONYC_OUTPUT = """\
+Reference ID    : C0A80001 (time.example.com)
+Stratum         : 3
+Ref time (UTC)  : Fri May 08 18:00:00 2026
+System time     : 0.000012345 seconds fast of NTP time
+Last offset     : -0.000001234 seconds
+Leap status     : Normal
+"""
+
+
+def _float(exp, coef):
+    return ((exp & 0x7f) << 25) | (coef & ((1 << 25) - 1))
+
+
+def _reply(sequence, correction=_float(24, 3), leap=0, status=0):
+    header = chrony_client._REPLY_HEADER.pack(
+        6, 2, 0, 0, 33, 5, status, 0, 0, 0, sequence, 0, 0)
+    body = chrony_client._TRACKING.pack(
+        0xC0A80001, socket.inet_aton('192.168.0.1').ljust(16, b'\0'), 1, 0,
+        2, leap, 0, 0, 0, correction, *([0] * 8))
+    return header + body
+
+
+def test_decode_float_handles_signed_exponent_and_coefficient():
+    assert _decode_float(_float(24, 3)) == 1.5
+    assert _decode_float(_float(23, -1)) == -0.25
+    assert _decode_float(_float(-5, 1)) == 2.0 ** -30
+
+
+def test_parse_tracking_reply():
+    assert parse_tracking_reply(_reply(7), 7) == {
+        'synced': True,
+        'leap_status': 'Normal',
+        'offset_ms': 1500.0,
+        'stratum': 2,
+        'source': '192.168.0.1',
+    }
+    assert parse_tracking_reply(_reply(7, leap=3), 7)['synced'] is False
+
+
+def test_parse_tracking_reply_rejects_mismatched_packets():
+    assert parse_tracking_reply(_reply(7), 8) is None
+    assert parse_tracking_reply(_reply(7, status=2), 7) is None
+    assert parse_tracking_reply(_reply(7)[:40], 7) is None
+
+
+def test_query_tracking_round_trip():
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(('127.0.0.1', 0))
+    received = []
+
+    def answer():
+        request, peer = server.recvfrom(1024)
+        received.append(request)
+        sequence = struct.unpack_from('>I', request, 8)[0]
+        server.sendto(_reply(sequence), peer)
+
+    thread = threading.Thread(target=answer)
+    thread.start()
+    try:
+        result = query_tracking(server.getsockname(), timeout=2)
+    finally:
+        thread.join()
+        server.close()
+
+    assert len(received[0]) == chrony_client._REQUEST_LENGTH
+    assert result['source'] == '192.168.0.1'
+    assert result['offset_ms'] == 1500.0
+
+
+def test_query_tracking_returns_none_without_chronyd():
+    server = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    server.bind(('127.0.0.1', 0))
+    try:
+        assert query_tracking(server.getsockname(), timeout=0.05) is None
+    finally:
+        server.close()
+
+
+def test_parse_tracking_output():
+    assert parse_tracking_output(CHRONYC_OUTPUT) == {
+        'synced': True,
+        'leap_status': 'Normal',
+        'offset_ms': 0.012,
+        'stratum': 3,
+        'source': 'time.example.com',
+    }
@@ -0,0 +1,101 @@
+"""Tests for ``session_overlap``.
+
+The index replaces the inline overlap loops in ``get_game_recordings`` and
+``preview_game_extraction``, so it must keep their rule exactly:
+``session_start < game_end and session_end > game_start``, with open
+sessions (no ``endedAt``) running up to now and sessions without a usable
+``startedAt`` skipped.
+"""
+
+from __future__ import annotations
+
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from session_overlap import SessionOverlapIndex, parse_iso8601, to_epoch  # noqa: E402
+
+
+def _session(sid, started_at, ended_at=None):
+    return {'id': sid, 'startedAt': started_at, 'endedAt': ended_at}
+
+
+def _ids(sessions):
+    return [s['id'] for s in sessions]
+
+
+SESSIONS = [
+    _session('morning', '2026-05-08T09:00:00Z', '2026-05-08T11:00:00Z'),
+    _session('evening', '2026-05-08T18:00:00Z', '2026-05-08T21:00:00Z'),
+    _session('late', '2026-05-08T20:30:00Z', '2026-05-08T23:00:00Z'),
+    _session('broken', 'not-a-date', '2026-05-08T23:00:00Z'),
+    _session('missing', None, None),
+]
+
+
+def test_to_epoch_handles_z_suffix_and_naive_datetimes():
+    expected = datetime(2026, 5, 8, 18, 0, tzinfo=timezone.utc).timestamp()
+    assert to_epoch('2026-05-08T18:00:00Z') == expected
+    assert to_epoch('2026-05-08T18:00:00+00:00') == expected
+    assert to_epoch(datetime(2026, 5, 8, 18, 0)) == expected
+    assert to_epoch('garbage') is None
+    assert to_epoch(None) is None
+
+
+def test_parse_iso8601_accepts_z_and_rejects_garbage():
+    parsed = parse_iso8601('2026-05-08T18:00:00.250000Z')
+    assert parsed == datetime(2026, 5, 8, 18, 0, 0, 250000, tzinfo=timezone.utc)
+    with pytest.raises(ValueError):
+        parse_iso8601('not-a-date')
+
+
+def test_skips_sessions_without_usable_start():
+    index = SessionOverlapIndex(SESSIONS)
+    assert len(index) == 3
+
+
+def test_overlapping_returns_matches_newest_first():
+    index = SessionOverlapIndex(SESSIONS)
+    matches = index.overlapping('2026-05-08T20:00:00Z', '2026-05-08T22:00:00Z')
+    assert _ids(matches) == ['late', 'evening']
+
+
+def test_touching_ranges_do_not_overlap():
+    index = SessionOverlapIndex(SESSIONS)
+    # Game starts exactly when the morning session ended
+    assert _ids(index.overlapping('2026-05-08T11:00:00Z', '2026-05-08T12:00:00Z')) == []
+    # Game ends exactly when the evening session started
+    assert _ids(index.overlapping('2026-05-08T17:00:00Z', '2026-05-08T18:00:00Z')) == []
+
+
+def test_open_session_and_open_game_extend_to_now():
+    started = (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat()
+    index = SessionOverlapIndex(SESSIONS + [_session('live', started)])
+    game_start = datetime.now(timezone.utc) - timedelta(minutes=10)
+    assert _ids(index.overlapping(game_start)) == ['live']
+
+
+def test_unparseable_range_raises():
+    index = SessionOverlapIndex(SESSIONS)
+    with pytest.raises(ValueError):
+        index.overlapping('nope', '2026-05-08T22:00:00Z')
+
+
+def test_long_and_open_sessions_before_the_scan_window_still_match():
+    sessions = SESSIONS + [
+        # Ran all day: started long before the short sessions' window
+        _session('all-day', '2026-05-08T06:00:00Z', '2026-05-08T22:30:00Z'),
+        # Never stopped: reaches every later range
+        _session('stuck', '2026-05-07T12:00:00Z'),
+        # Finished the day before
+        _session('yesterday', '2026-05-07T13:00:00Z', '2026-05-07T15:00:00Z'),
+    ]
+    index = SessionOverlapIndex(sessions)
+    matches = index.overlapping('2026-05-08T22:00:00Z', '2026-05-08T22:15:00Z')
+    assert _ids(matches) == ['late', 'all-day', 'stuck']
@@ -1833,9 +1833,13 @@ def process_game_videos(
         # that don't have local chapter files (sessions are stored on the Jetson that recorded them)
         jetson_id = os.getenv('JETSON_ID', 'unknown')
         logger.info(f"[ProcessGame] Filtering sessions for jetson_id: {jetson_id}")
-        all_sessions = firebase_service.get_recording_sessions(jetson_id=jetson_id, limit=100)
-        logger.info(f"[ProcessGame] Found {len(all_sessions)} sessions for {jetson_id}")
+        # Firestore returns only this Jetson's sessions that started in the
+        # game's window; the loop below still applies the exact checks
+        all_sessions = firebase_service.get_sessions_overlapping(game_start, game_end, jetson_id=jetson_id)
+        logger.info(f"[ProcessGame] Found {len(all_sessions)} candidate sessions for {jetson_id}")
         overlapping_sessions = []
+        # Open sessions (no endedAt) run up to now; read the clock once
+        now = datetime.now(game_start.tzinfo)
 
         for session in all_sessions:
             session_start_str = session.get('startedAt')
@@ -1863,7 +1867,7 @@ def process_game_videos(
                 continue
 
             s_start = datetime.fromisoformat(session_start_str.replace('Z', '+00:00'))
-            s_end = datetime.fromisoformat(session_end_str.replace('Z', '+00:00')) if session_end_str else datetime.now(s_start.tzinfo)
+            s_end = datetime.fromisoformat(session_end_str.replace('Z', '+00:00')) if session_end_str else now
 
             # Check overlap
             if s_start < game_end and s_end > game_start: